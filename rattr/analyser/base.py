@@ -3,17 +3,85 @@ from __future__ import annotations
 
 import ast
 from abc import ABCMeta, abstractmethod
-from ast import NodeVisitor
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from rattr import error
 from rattr.analyser.types import FunctionIr
 from rattr.models.context import Context
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
     from rattr.ast.types import Identifier
 
 
+class NodeVisitor(ast.NodeVisitor):
+    """An `ast.NodeVisitor` which caches the visitor method for each node type.
+
+    `ast.NodeVisitor.visit` builds the method name and looks it up on every node, here
+    the method is resolved once per visitor class and node type.
+
+    """
+
+    _visitors: ClassVar[dict[type[ast.AST], Callable[[Any, Any], Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visitors = {}
+
+    @classmethod
+    def _resolve_visitor(cls, node_type: type[ast.AST]) -> Callable[[Any, Any], Any]:
+        visitor = getattr(cls, f"visit_{node_type.__name__}", cls.generic_visit)
+        cls._visitors[node_type] = visitor
+        return visitor
+
+    def visit(self, node: ast.AST) -> Any:
+        """Visit a node."""
+        try:
+            visitor = self._visitors[type(node)]
+        except KeyError:
+            visitor = self._resolve_visitor(type(node))
+
+        return visitor(self, node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit the children of a node.
+
+        Descendants which would themselves only be visited generically are walked from an
+        explicit stack rather than by recursion, the order of visiting is unchanged.
+
+        """
+        stack: list[ast.AST] = _children_reversed(node)
+
+        while stack:
+            child = stack.pop()
+
+            try:
+                visitor = self._visitors[type(child)]
+            except KeyError:
+                visitor = self._resolve_visitor(type(child))
+
+            if visitor is NodeVisitor.generic_visit:
+                stack.extend(_children_reversed(child))
+            else:
+                visitor(self, child)
+
+
+def _children_reversed(node: ast.AST) -> list[ast.AST]:
+    children: list[ast.AST] = []
+
+    for field in reversed(node._fields):
+        value = getattr(node, field, None)
+
+        if isinstance(value, list):
+            children.extend(v for v in reversed(value) if isinstance(v, ast.AST))
+        elif isinstance(value, ast.AST):
+            children.append(value)
+
+    return children
+
+
 class Assertor(NodeVisitor):
     """Assertor base class.
 
@@ -24,8 +92,13 @@ class Assertor(NodeVisitor):
         not is_strict:
             on condition failure, log warning
 
+    An assertor which never mutates the context it is given should set `READ_ONLY` to
+    `True`, it will then be given the context itself rather than a copy.
+
     """
 
+    READ_ONLY: bool = False
+
     def __init__(self, is_strict: bool = True) -> None:
         self.is_strict: bool = is_strict
 
@@ -14,6 +14,7 @@ from rattr.analyser.base import NodeVisitor
 from rattr.analyser.function import FunctionAnalyser
 from rattr.analyser.types import ClassIr
 from rattr.analyser.util import has_annotation, parse_rattr_results_from_annotation
+from rattr.ast.types import AstFunctionDef
 from rattr.ast.util import assignment_targets, fullname_of, unravel_names
 from rattr.models.context import Context
 from rattr.models.ir import FunctionIr
@@ -26,7 +27,7 @@ if TYPE_CHECKING:
 
 
 def is_method(node: ast.stmt) -> bool:
-    return isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    return isinstance(node, AstFunctionDef)
 
 
 def init_method_or_none(
@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import ast
-import copy
+import io
+import multiprocessing
+import sys
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stderr
 from typing import TYPE_CHECKING
 
 import attrs
@@ -25,12 +29,10 @@ from rattr.ast.util import (
     assignment_targets,
     fullname_of,
     has_lambda_in_rhs,
-    has_namedtuple_declaration_in_rhs,
-    walruses_in_rhs,
+    summarise_rhs,
 )
 from rattr.config import Config
 from rattr.config.state import enter_file
-from rattr.extra import DictChanges
 from rattr.models.context import Context, compile_root_context
 from rattr.models.ir import FileIr
 from rattr.models.symbol import Import
@@ -38,7 +40,16 @@ from rattr.module_locator.util import is_in_import_blacklist, is_in_pip, is_in_s
 from rattr.plugins import plugins
 
 if TYPE_CHECKING:
-    from rattr.models.symbol import Func
+    from collections.abc import Callable, Iterable, Iterator
+
+    from rattr.ast.types import Identifier
+    from rattr.models.ir import FunctionIr
+    from rattr.models.symbol import Func, UserDefinedCallableSymbol
+
+    _AnalyseOriginsFn = Callable[
+        [Iterable[str]],
+        Iterable[tuple[FileIr, tuple[Import, ...], int]],
+    ]
 
 
 @attrs.mutable
@@ -78,14 +89,22 @@ def __parse_and_analyse_file_impl() -> tuple[FileIr, ImportIrs, RattrStats]:
     config = Config()
 
     with timer() as parse_timer, read(config.arguments.target) as (file_lines, source):
-        ast_module = ast.parse(source)
+        ast_module = ast.parse(
+            source,
+            filename=config.arguments.target,
+            feature_version=sys.version_info[:2],
+        )
+        del source
 
     with timer() as root_context_timer:
         context = compile_root_context(ast_module).expand_starred_imports()
 
     with timer() as assert_timer:
         for assertor in plugins.assertors:
-            assertor.assert_holds(ast_module, copy.deepcopy(context))
+            if assertor.READ_ONLY:
+                assertor.assert_holds(ast_module, context)
+            else:
+                assertor.assert_holds(ast_module, context.snapshot())
 
     with timer() as analyse_imports_timer:
         if config.arguments.follow_imports:
@@ -119,78 +138,175 @@ def parse_and_analyse_imports(
     Imports are a directed cyclic graph, however, previously analysed files can
     just be ignored (analysing is deterministic and context-free). Thus, the
     graph of imports becomes a DAG which we BFS.
+
+    When `--jobs` is greater than one each level of the BFS is analysed in parallel,
+    otherwise each import is analysed as it is dequeued.
     """
     config = Config()
     queue = deque(imports)
+    jobs = config.arguments.jobs
 
     import_irs: ImportIrs = {}
+    import_lines = 0
+    number_of_imports = 0
+
+    seen_module_origins: set[str] = set()
+
+    with __origin_analyser(jobs) as analyse_origins:
+        while queue:
+            origins_to_names: dict[str, Identifier] = {}
+
+            while queue and (jobs > 1 or not origins_to_names):
+                import_ = queue.popleft()
+                number_of_imports += 1
+
+                if (resolved := __resolve_import(import_)) is None:
+                    continue
+
+                name, origin = resolved
+
+                if origin in seen_module_origins or origin in origins_to_names:
+                    continue
+
+                if __is_followed(name):
+                    origins_to_names[origin] = name
+
+            results = analyse_origins(origins_to_names)
+
+            for (origin, name), result in zip(origins_to_names.items(), results):
+                import_ir, imports_in_the_current_import, import_file_lines = result
+                import_irs[name] = import_ir
+
+                for next_import in imports_in_the_current_import:
+                    queue.append(next_import)
+
+                import_lines += import_file_lines
+
+                seen_module_origins.add(origin)
+
     import_stats = RattrImportStats(
-        import_lines=0,
-        number_of_imports=0,
-        number_of_unique_imports=0,
+        import_lines=import_lines,
+        number_of_imports=number_of_imports,
+        number_of_unique_imports=len(seen_module_origins),
     )
+    return import_irs, import_stats
 
-    seen_module_origins: set[str] = set()
 
-    while queue:
-        import_ = queue.popleft()
-        import_stats.number_of_imports += 1
+def __resolve_import(import_: Import) -> tuple[Identifier, str] | None:
+    """Return the module name and origin of the import, or `None` if unresolvable."""
+    name = import_.module_name
+    spec = import_.module_spec
 
-        name = import_.module_name
-        spec = import_.module_spec
+    if name is None:
+        error.error(f"unable to resolve import {import_.qualified_name!r}")
+        return None
 
-        if name is None:
+    if spec is None:
+        error.error(f"unable to resolve module spec for {name!r}")
+        return None
+
+    if spec.origin is None:
+        # HACK Can't use isinstance
+        # TODO Resolve BuiltinImporter modules
+        if "BuiltinImporter" in str(getattr(spec, "loader", None)):
+            error.error(f"unable to resolve builtin module {name!r}", badness=0)
+        else:
             error.error(f"unable to resolve import {import_.qualified_name!r}")
-            continue
+        return None
 
-        if spec is None:
-            error.error(f"unable to resolve module spec for {name!r}")
-            continue
+    return name, spec.origin
 
-        if spec.origin is None:
-            # HACK Can't use isinstance
-            # TODO Resolve BuiltinImporter modules
-            if "BuiltinImporter" in str(getattr(spec, "loader", None)):
-                error.error(f"unable to resolve builtin module {name!r}", badness=0)
-            else:
-                error.error(f"unable to resolve import {import_.qualified_name!r}")
-            continue
 
-        if spec.origin in seen_module_origins:
-            continue
+def __is_followed(name: Identifier) -> bool:
+    """Return `True` if imports of the given module should be followed."""
+    config = Config()
 
-        if is_in_import_blacklist(name):
-            continue
+    if is_in_import_blacklist(name):
+        return False
 
-        if not config.arguments.follow_pip_imports and is_in_pip(name):
-            continue
+    if not config.arguments.follow_pip_imports and is_in_pip(name):
+        return False
 
-        if not config.arguments.follow_stdlib_imports and is_in_stdlib(name):
-            continue
+    if not config.arguments.follow_stdlib_imports and is_in_stdlib(name):
+        return False
 
-        with read(spec.origin) as (import_file_lines, import_file_source):
-            import_ast = ast.parse(import_file_source)
+    return True
 
-        with enter_file(spec.origin):
-            import_context = compile_root_context(import_ast).expand_starred_imports()
-            import_ir = FileAnalyser(import_ast, import_context).analyse()
 
-        import_irs[name] = import_ir
+@contextmanager
+def __origin_analyser(jobs: int) -> Iterator[_AnalyseOriginsFn]:
+    """Yield a function to analyse origins, in `jobs` processes if more than one.
 
-        imports_in_the_current_import = [
-            symbol
-            for symbol in import_context.symbol_table.symbols
-            if isinstance(symbol, Import)
-        ]
-        for next_import in imports_in_the_current_import:
-            queue.append(next_import)
+    The workers are forked so that they inherit the config, plugins, etc.
+    """
+    if jobs <= 1:
+        yield lambda origins: map(analyse_origin, origins)
+        return
 
-        import_stats.import_lines += import_file_lines
+    config = Config()
 
-        seen_module_origins.add(spec.origin)
+    def _analyse_origins(
+        origins: Iterable[str],
+    ) -> Iterator[tuple[FileIr, tuple[Import, ...], int]]:
+        # Results are in submission order, thus so are the diagnostics
+        for result, badness, diagnostics in executor.map(
+            __analyse_origin_in_worker,
+            origins,
+        ):
+            config.state.badness_from_imports += badness
+            sys.stderr.write(diagnostics)
 
-    import_stats.number_of_unique_imports = len(seen_module_origins)
-    return import_irs, import_stats
+            if isinstance(result, SystemExit):
+                raise result
+
+            yield result
+
+    mp_context = multiprocessing.get_context("fork")
+
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as executor:
+        yield _analyse_origins
+
+
+def __analyse_origin_in_worker(
+    origin: str,
+) -> tuple[tuple[FileIr, tuple[Import, ...], int] | SystemExit, int, str]:
+    """Return the analysis of the origin, its badness, and its diagnostics.
+
+    The worker's config state is discarded with the worker, thus the badness must be
+    returned to be added to that of the parent. Likewise the diagnostics are buffered
+    and returned, so that the parent may write them whole and in order rather than
+    interleaved with those of other workers. A fatal error is returned rather than
+    raised, so that it is raised by the parent after its diagnostics are written.
+    """
+    state = Config().state
+    badness_before = state.badness_from_imports
+
+    with redirect_stderr(io.StringIO()) as diagnostics:
+        try:
+            result = analyse_origin(origin)
+        except SystemExit as exc:
+            result = exc
+
+    return result, state.badness_from_imports - badness_before, diagnostics.getvalue()
+
+
+def analyse_origin(origin: str) -> tuple[FileIr, tuple[Import, ...], int]:
+    """Return the IR, the imports, and the number of lines of the given file."""
+    with read(origin) as (file_lines, file_source):
+        file_ast = ast.parse(
+            file_source,
+            filename=origin,
+            feature_version=sys.version_info[:2],
+        )
+        del file_source
+
+    with enter_file(origin):
+        context = compile_root_context(file_ast).expand_starred_imports()
+        file_ir = FileAnalyser(file_ast, context).analyse()
+
+    imports = tuple(s for s in context.symbol_table.symbols if isinstance(s, Import))
+
+    return file_ir, imports, file_lines
 
 
 class FileAnalyser(NodeVisitor):
@@ -202,12 +318,22 @@ class FileAnalyser(NodeVisitor):
         self.context = context
         self.file_ir = FileIr(context=context)
 
+        # The symbols newly added to the file IR during the current walrus visit
+        self._added: list[UserDefinedCallableSymbol] | None = None
+
     def analyse(self) -> FileIr:
         """Entry point of FileAnalyser, return the results of analysis."""
         self.visit(self._ast)
 
         return self.file_ir
 
+    def _add(self, symbol: UserDefinedCallableSymbol, ir: FunctionIr) -> None:
+        """Set the IR of the given symbol, recording it if it is new."""
+        if self._added is not None and symbol not in self.file_ir:
+            self._added.append(symbol)
+
+        self.file_ir[symbol] = ir
+
     def visit_AnyFunctionDef(
         self,
         node: ast.FunctionDef | ast.AsyncFunctionDef,
@@ -229,17 +355,14 @@ class FileAnalyser(NodeVisitor):
         if plugins.has_analyser(fn, modulename=self.context.modulename):
             return self.visit_function_with_custom_analyser(node, fn)
 
-        self.file_ir[fn] = FunctionAnalyser(node, self.context).analyse()
+        self._add(fn, FunctionAnalyser(node, self.context).analyse())
 
     def visit_function_with_rattr_results_annotation(
         self,
         node: ast.FunctionDef | ast.AsyncFunctionDef,
         fn: Func,
     ) -> None:
-        self.file_ir[fn] = parse_rattr_results_from_annotation(
-            node,
-            context=self.context,
-        )
+        self._add(fn, parse_rattr_results_from_annotation(node, context=self.context))
 
     def visit_function_with_custom_analyser(
         self,
@@ -249,7 +372,7 @@ class FileAnalyser(NodeVisitor):
         custom_analyser = plugins.get_analyser(fn, modulename=self.context.modulename)
         if custom_analyser is None:
             raise RuntimeError(f"{fn.name} has no custom analyser")  # never
-        self.file_ir[fn] = custom_analyser.on_def(fn.id, node, self.context)
+        self._add(fn, custom_analyser.on_def(fn.id, node, self.context))
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         self.visit_AnyFunctionDef(node)
@@ -267,7 +390,7 @@ class FileAnalyser(NodeVisitor):
         class_ir = ClassAnalyser(node, self.context).analyse()
 
         for foc, foc_ir in class_ir.items():
-            self.file_ir[foc] = foc_ir
+            self._add(foc, foc_ir)
 
     # ----------------------------------------------------------------------- #
     # Lambdas
@@ -276,69 +399,82 @@ class FileAnalyser(NodeVisitor):
     def visit_LambdaAssign(
         self,
         node: ast.Assign | ast.AnnAssign | ast.AugAssign | ast.NamedExpr,
+        target_name: Identifier | None,
     ) -> None:
-        if not assignment_is_one_to_one(node):
+        if target_name is None:
             return error.fatal("lambda assignment must be one-to-one", node)
 
-        targets = assignment_targets(node)
-        name = fullname_of(targets[0])
-
         try:
-            fn = self.context.get_func_or_error(name)
+            fn = self.context.get_func_or_error(target_name)
         except KeyError as exc:
             return error.error(str(exc.args[0]), culprit=node)
 
         if node.value is None:
             raise RuntimeError("lambda has no body")  # never
 
-        self.file_ir[fn] = FunctionAnalyser(node.value, self.context).analyse()
+        self._add(fn, FunctionAnalyser(node.value, self.context).analyse())
 
     def visit_NamedTupleAssign(
         self,
         node: ast.Assign | ast.AnnAssign | ast.AugAssign | ast.NamedExpr,
+        target_name: Identifier | None,
     ) -> None:
-        if not assignment_is_one_to_one(node):
+        if target_name is None:
             return error.fatal("namedtuple assignment must be one-to-one", node)
 
-        name = fullname_of(assignment_targets(node)[0])
-
         try:
-            cls = self.context.get_class_or_error(name)
+            cls = self.context.get_class_or_error(target_name)
         except KeyError as exc:
             return error.error(str(exc.args[0]), culprit=node)
 
-        self.file_ir[cls] = {
-            "gets": set(),
-            "sets": set(),
-            "dels": set(),
-            "calls": set(),
-        }
+        self._add(
+            cls,
+            {
+                "gets": set(),
+                "sets": set(),
+                "dels": set(),
+                "calls": set(),
+            },
+        )
 
     def visit_AnyAssign(
         self,
         node: ast.Assign | ast.AnnAssign | ast.AugAssign | ast.NamedExpr,
     ) -> None:
-        if has_lambda_in_rhs(node):
-            self.visit_LambdaAssign(node)
+        rhs = summarise_rhs(node)
+
+        if not (rhs.has_lambda or rhs.has_namedtuple_declaration or rhs.walruses):
+            return
+
+        # The target name is shared by each branch below, so derive it exactly once
+        if assignment_is_one_to_one(node):
+            target_name = fullname_of(assignment_targets(node)[0])
+        else:
+            target_name = None
+
+        if rhs.has_lambda:
+            self.visit_LambdaAssign(node, target_name)
 
-        if has_namedtuple_declaration_in_rhs(node):
-            self.visit_NamedTupleAssign(node)
+        if rhs.has_namedtuple_declaration:
+            self.visit_NamedTupleAssign(node, target_name)
 
         # Walrus may obscure a lambda, so peek in and visit the nice walruses
-        for walrus in walruses_in_rhs(node):
-            with DictChanges(self.file_ir) as diff:
-                self.visit_AnyAssign(walrus)
+        for walrus in rhs.walruses:
+            # Record the symbols added by the walrus, and pass them on to any
+            # enclosing walrus as they are also added within it
+            enclosing, self._added = self._added, []
+            self.visit_AnyAssign(walrus)
+            added, self._added = self._added, enclosing
+            if enclosing is not None:
+                enclosing.extend(added)
 
             # Handle `outer_lhs = (inner_lhs := lambda: ...)`
             if has_lambda_in_rhs(walrus):
-                if len(diff.added) == 1 and node.value == walrus:
-                    inner_rhs = list(diff.added)[0]
-                    outer_lhs = attrs.evolve(
-                        inner_rhs,
-                        name=fullname_of(assignment_targets(node)[0]),
-                    )
-                    self.file_ir[outer_lhs] = self.file_ir[inner_rhs]
-                elif len(diff.added) > 1:
+                if len(added) == 1 and node.value == walrus and target_name:
+                    inner_rhs = added[0]
+                    outer_lhs = attrs.evolve(inner_rhs, name=target_name)
+                    self._add(outer_lhs, self.file_ir[inner_rhs])
+                elif len(added) > 1:
                     raise NotImplementedError("Multiple deeply nested walruses")
 
     def visit_Assign(self, node: ast.Assign) -> None:
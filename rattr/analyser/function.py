@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import ast
-from itertools import accumulate
+import sys
 from typing import TYPE_CHECKING
 
 from rattr import error
@@ -12,13 +12,17 @@ from rattr.analyser.util import (
     class_in_rhs,
     get_assignment_targets,
     get_function_body,
-    is_call_to,
     lambda_in_rhs,
     namedtuple_in_rhs,
 )
-from rattr.ast.types import AstFunctionDefOrLambda, AstNodeWithName
+from rattr.ast.types import (
+    AstFunctionDef,
+    AstFunctionDefOrLambda,
+    AstNodeWithName,
+)
 from rattr.ast.util import (
     fullname_of,
+    is_call_to_python_attr_access_fn,
     namedtuple_init_signature_from_declaration,
     names_of,
 )
@@ -37,23 +41,22 @@ from rattr.models.symbol.util import without_call_brackets
 from rattr.plugins import plugins
 
 if TYPE_CHECKING:
+    from typing import Final, Literal
+
     from rattr.models.plugins import CustomFunctionAnalyser
+    from rattr.versioning.typing import TypeAlias
 
+    _IrNameKey: TypeAlias = Literal["sets", "gets", "dels"]
 
-def custom_analyser_for_target(
-    node: ast.Call,
-    context: Context,
-) -> CustomFunctionAnalyser | None:
-    target_name = without_call_brackets(
-        fullname_of(
-            node,
-            unravel_attr_access_calls=False,
-            safe=True,
-        )
-    )
-    target_symbol = context.get_call_target(target_name, node, warn=False)
 
-    return plugins.get_analyser(target_symbol, modulename=context.modulename)
+_IR_KEY_BY_EXPR_CONTEXT: Final[dict[type, _IrNameKey]] = {
+    ast.Store: "sets",
+    ast.Load: "gets",
+    ast.Del: "dels",
+}
+
+_SPECIAL_RETURN_VALUES: Final = (ast.Tuple, ast.List, ast.Set, ast.Dict, ast.Call)
+"""Return values which are unpacked or may initialise a class, see `visit_ReturnValue`."""
 
 
 class FunctionAnalyser(NodeVisitor):
@@ -76,13 +79,17 @@ class FunctionAnalyser(NodeVisitor):
         self.context: Context = context
         """Managed by `new_context`."""
 
+        self._names: dict[tuple[_IrNameKey, str, str], Name] = {}
+        """The name symbols previously added to the IR, see `add_name`."""
+
     def analyse(self) -> FunctionIr:
         """Entry point, return the results of analysis."""
         with new_context(self):
             self.context.add_arguments_to_context(self.ast.args, token=self.ast)
 
+            visit = self.visit
             for stmt in get_function_body(self.ast):
-                self.visit(stmt)
+                visit(stmt)
 
         return self.func_ir
 
@@ -92,29 +99,53 @@ class FunctionAnalyser(NodeVisitor):
         ctx: ast.expr_context,
     ) -> tuple[str, str]:
         """Return the name, also verify validity."""
-        config = Config()
-
         base, full = names_of(node, safe=True)
 
-        is_undeclared = base not in self.context
-        is_assignment = isinstance(ctx, ast.Store)
-        is_literal = base.startswith(config.LITERAL_VALUE_PREFIX)
-
-        if is_undeclared and not is_assignment and not is_literal:
-            error.warning(f"{base!r} potentially undefined", node)
+        if not isinstance(ctx, ast.Store):
+            self.verify_basename(node, base)
 
         return base, full
 
-    def update_results(self, symbol: Name, ctx: ast.expr_context) -> None:
+    def verify_basename(self, node: ast.expr, base: str) -> None:
+        """Warn if the given basename is not defined."""
+        # Cheapest first, the context lookup may walk every parent context
+        if (
+            not base.startswith(Config.LITERAL_VALUE_PREFIX)
+            and base not in self.context
+        ):
+            error.warning(f"{base!r} potentially undefined", node)
+
+    def update_results(
+        self,
+        fullname: str,
+        basename: str,
+        token: ast.AST,
+        ctx: ast.expr_context,
+    ) -> None:
         """Add the given name to the result."""
-        if isinstance(ctx, ast.Store):
-            self.func_ir["sets"].add(symbol)
+        if (key := _IR_KEY_BY_EXPR_CONTEXT.get(type(ctx))) is not None:
+            self.add_name(key, fullname, basename, token)
 
-        if isinstance(ctx, ast.Load):
-            self.func_ir["gets"].add(symbol)
+    def add_name(
+        self,
+        key: _IrNameKey,
+        fullname: str,
+        basename: str,
+        token: ast.AST,
+    ) -> None:
+        """Add the given name to the IR under the given key.
+
+        The IR keeps the first of equal names, thus the symbol of a repeated name is
+        reused rather than constructed again. The new symbol's names are interned s.t.
+        comparing equal names when merging IRs is by identity.
+        """
+        names_key = (key, fullname, basename)
 
-        if isinstance(ctx, ast.Del):
-            self.func_ir["dels"].add(symbol)
+        if (symbol := self._names.get(names_key)) is None:
+            symbol = Name(sys.intern(fullname), sys.intern(basename), token=token)
+            self._names[names_key] = symbol
+
+        self.func_ir[key].add(symbol)
 
     # ----------------------------------------------------------------------- #
     # Result alterors: variables, call expressions, and subscripting
@@ -123,7 +154,7 @@ class FunctionAnalyser(NodeVisitor):
     def visit_Name(self, node: ast.Name) -> None:
         """Visit ast.Name(id: str, ctx: ast.expr_context)."""
         basename, fullname = self.get_and_verify_name(node, node.ctx)
-        self.update_results(Name(fullname, basename, token=node), node.ctx)
+        self.update_results(fullname, basename, node, node.ctx)
 
     def visit_compound_name(
         self,
@@ -142,7 +173,7 @@ class FunctionAnalyser(NodeVisitor):
         if not isinstance(node.value, AstNodeWithName):
             self.visit(node.value)
 
-        self.update_results(Name(fullname, basename, token=node), node.ctx)
+        self.update_results(fullname, basename, node, node.ctx)
 
     def visit_Starred(self, node: ast.Starred) -> None:
         self.visit_compound_name(node)
@@ -155,13 +186,35 @@ class FunctionAnalyser(NodeVisitor):
 
     def visit_Call(self, node: ast.Call) -> None:
         """Visit ast.Call(func, args, keywords)."""
-        config = Config()
+        # The callee's names and target are shared by the custom analyser lookup and the
+        # call itself, the target's warning is deferred until the call is analysed
+        basename, func_name = names_of(node.func, safe=True)
+        fullname = f"{func_name}()"
+        resolution = self.context.resolve_call_target(fullname, node)
+        callee = without_call_brackets(func_name)
+
+        analyser = plugins.get_analyser(
+            resolution.target,
+            modulename=self.context.modulename,
+        )
+        if analyser is not None:
+            return self.visit_call_to_target_with_custom_analyser(
+                node,
+                analyser,
+                target_name=callee,
+            )
+
+        # Special case: `getattr`, etc, are named by the attribute they access
+        if basename in PYTHON_ATTR_ACCESS_BUILTINS:
+            _, fullname = names_of(node, safe=True)
+            callee = without_call_brackets(fullname)
+            resolution = self.context.resolve_call_target(fullname, node)
 
-        if (analyser := custom_analyser_for_target(node, self.context)) is not None:
-            return self.visit_call_to_target_with_custom_analyser(node, analyser)
+        self.verify_basename(node, basename)
 
-        _, fullname = self.get_and_verify_name(node, ast.Load())
-        target = self.context.get_call_target(fullname, node, warn=True)
+        target, diagnostic = resolution
+        if diagnostic is not None:
+            diagnostic()
 
         # NOTE
         # Add the call to the IR and manually visit the arguments, but not `node.func`
@@ -169,40 +222,40 @@ class FunctionAnalyser(NodeVisitor):
 
         if isinstance(target, Class):
             error.warning(f"{target.name!r} initialised but not stored", node)
-            self_name = config.LITERAL_VALUE_PREFIX + target.name
+            self_name = Config.LITERAL_VALUE_PREFIX + target.name
         else:
             self_name = None
 
-        # TODO Refactor
-        # On a call to `cls.member.method()` then it must get `class.member`
-        parts = without_call_brackets(fullname).split(".")[:-1]
-        for attr in list(accumulate(parts, lambda a, b: f"{a}.{b}"))[1:]:
-            self.func_ir["gets"].add(Name(attr, parts[0], token=node))
+        # On a call to `cls.member.method()` then it must get `cls.member`, that is each
+        # dotted prefix of the callee save for the basename and the callee itself
+        basename, _, _ = callee.partition(".")
+
+        dot = callee.find(".", len(basename) + 1)
+        while dot != -1:
+            self.add_name("gets", callee[:dot], basename, node)
+            dot = callee.find(".", dot + 1)
 
         call = Call.from_call(fullname, call=node, target=target, self=self_name)
         self.func_ir["calls"].add(call)
 
+        visit = self.visit
         for arg in (*node.args, *node.keywords):
-            self.visit(arg)
+            visit(arg)
 
     def visit_call_to_target_with_custom_analyser(
         self,
         node: ast.Call,
         custom_analyser: CustomFunctionAnalyser,
+        *,
+        target_name: str,
     ) -> None:
-        target_name = without_call_brackets(
-            fullname_of(
-                node,
-                unravel_attr_access_calls=False,
-                safe=True,
-            )
-        )
         target_call_ir = custom_analyser.on_call(target_name, node, self.context)
 
-        self.func_ir["gets"] |= target_call_ir["gets"]
-        self.func_ir["sets"] |= target_call_ir["sets"]
-        self.func_ir["dels"] |= target_call_ir["dels"]
-        self.func_ir["calls"] |= target_call_ir["calls"]
+        func_ir = self.func_ir
+        func_ir["gets"].update(target_call_ir["gets"])
+        func_ir["sets"].update(target_call_ir["sets"])
+        func_ir["dels"].update(target_call_ir["dels"])
+        func_ir["calls"].update(target_call_ir["calls"])
 
     # ----------------------------------------------------------------------- #
     # Context alterors: assignments and deleteion
@@ -282,15 +335,16 @@ class FunctionAnalyser(NodeVisitor):
         self.func_ir["calls"].add(call)
 
         # Create set to LHS
-        self.func_ir["sets"].add(Name(lhs_name, lhs_basename, token=node))
+        self.add_name("sets", lhs_name, lhs_basename, node)
 
         # Register assignments
         for target in targets:
             self.context.add_identifiers_to_context(target)
 
         # Visit call arguments
+        visit = self.visit
         for arg in (*node.value.args, *node.value.keywords):
-            self.visit(arg)
+            visit(arg)
 
     def visit_AnyAssign(
         self,
@@ -398,15 +452,16 @@ class FunctionAnalyser(NodeVisitor):
         else:
             error.error("unable to unbind anonymous lambdas", node)
 
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        if isinstance(node, AstFunctionDef):
             self.context.add(Func.from_fn_def(node))
 
         # TODO Allow nested -- FunctionAnalyser on name "outer.inner"
         with new_context(self):
             self.context.add_arguments_to_context(node.args, token=node)
 
+            visit = self.visit
             for stmt in get_function_body(node):
-                self.visit(stmt)
+                visit(stmt)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         self.visit_AnyFunctionDef(node)
@@ -432,19 +487,22 @@ class FunctionAnalyser(NodeVisitor):
         with new_context(self):
             # Visit the comprehensions first as they may define some of the names in
             # `names`, thus avoiding erroneous "potentially undefined" warnings.
+            visit = self.visit
+
             for comprehension in node.generators:
-                self.visit(comprehension)
+                visit(comprehension)
 
             for name in names:
-                self.visit(name)
+                visit(name)
 
     def visit_comprehension(self, node: ast.comprehension) -> None:
         # Add the target (i.e. in `for x in xs` then `x` is the target) to the context
         # first to avoid "'x' potentially undefined".
         self.context.add_identifiers_to_context(node.target)
 
+        visit = self.visit
         for expr in (node.target, node.iter, *node.ifs):
-            self.visit(expr)
+            visit(expr)
 
     def visit_ListComp(self, node: ast.ListComp) -> None:
         self._visit_any_comprehension_or_generator_expr(node, [node.elt])
@@ -462,75 +520,95 @@ class FunctionAnalyser(NodeVisitor):
     # Special cases
     # ----------------------------------------------------------------------- #
 
-    def visit_ReturnValue(self, node: ast.expr | None) -> bool:
-        """Helper method to handle a return value / tuple elt.
+    def visit_ReturnValue(self, node: ast.expr | None) -> None:
+        """Helper method to handle a return value, unpacking literal containers.
 
-        Returns True if the return value has been fully handled.
+        The elements of tuple, list, set, and dict literals are visited as though they
+        were returned individually.
 
         """
-        if node is None:
-            return True
-
-        if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
-            for elt in node.elts:
-                handled = self.visit_ReturnValue(elt)
+        stack: list[ast.expr | None] = [node]
 
-                if not handled:
-                    self.visit(elt)
+        while stack:
+            value = stack.pop()
 
-            return True
+            if value is None:
+                continue
 
-        if isinstance(node, ast.Dict):
-            for elt in (*node.keys, *node.values):
-                handled = self.visit_ReturnValue(elt)
+            if isinstance(value, (ast.Tuple, ast.List, ast.Set)):
+                stack.extend(reversed(value.elts))
+            elif isinstance(value, ast.Dict):
+                stack.extend(reversed((*value.keys, *value.values)))
+            elif not (isinstance(value, ast.Call) and self.visit_ReturnCall(value)):
+                self.visit(value)
 
-                if not handled and elt is not None:
-                    self.visit(elt)
+    def visit_ReturnCall(self, node: ast.Call) -> bool:
+        """Helper method to handle a returned call.
 
-            return True
+        Returns True if the call has been fully handled.
 
-        if isinstance(node, ast.Call):
-            # NOTE
-            #   get_basename_fullname_pair on getattr, etc. produces a name
-            #   incompatible with Context::get_call_target
-            if any(is_call_to(f, node) for f in PYTHON_ATTR_ACCESS_BUILTINS):
-                return False
+        """
+        # NOTE
+        #   get_basename_fullname_pair on getattr, etc. produces a name
+        #   incompatible with Context::get_call_target
+        if is_call_to_python_attr_access_fn(node):
+            return False
 
-            target = self.context.get_call_target(
-                fullname_of(node, safe=True),
-                node,
-                warn=False,
-            )
+        init_body, diagnostic = self.context.resolve_call_target(
+            fullname_of(node, safe=True),
+            node,
+        )
 
-            if not isinstance(target, Class):
-                return False
-
-            # Create call to class initialiser
-            class_name = fullname_of(node)
-            init_body = self.context.get_call_target(class_name, node)
-            call = Call.from_call(
-                class_name,
-                call=node,
-                target=init_body,
-                self="@ReturnValue",
-            )
-            self.func_ir["calls"].add(call)
+        if not isinstance(init_body, Class):
+            return False
 
-            # Visit call arguments
-            for arg in (*node.args, *node.keywords):
-                self.visit(arg)
+        # Create call to class initialiser
+        class_name = fullname_of(node)
+        if diagnostic is not None:
+            diagnostic()
+        call = Call.from_call(
+            class_name,
+            call=node,
+            target=init_body,
+            self="@ReturnValue",
+        )
+        self.func_ir["calls"].add(call)
 
-            return True
+        # Visit call arguments
+        visit = self.visit
+        for arg in (*node.args, *node.keywords):
+            visit(arg)
 
-        return False
+        return True
 
     def visit_Return(self, node: ast.Return) -> None:
         """Visit ast.Return(value)."""
-        handled = self.visit_ReturnValue(node.value)
-
-        if not handled and node.value is not None:
+        # Most returns are of a name, attribute, etc, which need no special handling
+        if isinstance(node.value, _SPECIAL_RETURN_VALUES):
+            self.visit_ReturnValue(node.value)
+        elif node.value is not None:
             self.visit(node.value)
 
+    # ----------------------------------------------------------------------- #
+    # Trivial nodes: skip the generic visit
+    # ----------------------------------------------------------------------- #
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        return
+
+    def visit_Pass(self, node: ast.Pass) -> None:
+        return
+
+    def visit_Break(self, node: ast.Break) -> None:
+        return
+
+    def visit_Continue(self, node: ast.Continue) -> None:
+        return
+
+    def visit_Expr(self, node: ast.Expr) -> None:
+        """Visit ast.Expr(value)."""
+        self.visit(node.value)
+
     # ----------------------------------------------------------------------- #
     # THE FORBIDDEN ZONE: A zone... that is, yes... FORBIDDEN to you.
     # ----------------------------------------------------------------------- #
@@ -5,9 +5,9 @@ from typing import TYPE_CHECKING, TypedDict
 from rattr.ast.types import (  # noqa: F401
     Identifier,
 )
-from rattr.models.ir import FileIr, FunctionIr
+from rattr.models.ir import FunctionIr
 from rattr.models.symbol import UserDefinedCallableSymbol
-from rattr.versioning.typing import TypeAlias
+from rattr.models.util._types import ImportIrs  # noqa: F401
 
 if TYPE_CHECKING:
     from rattr.versioning.typing import TypeAlias
@@ -15,9 +15,6 @@ if TYPE_CHECKING:
 
 ClassIr: TypeAlias = dict[UserDefinedCallableSymbol, FunctionIr]
 
-_ModuleName: TypeAlias = str
-ImportIrs: TypeAlias = dict[_ModuleName, FileIr]
-
 
 TargetName: TypeAlias = Identifier
 PositionalArgumentName: TypeAlias = Identifier
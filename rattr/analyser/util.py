@@ -5,9 +5,9 @@ import ast
 import builtins
 import io
 import re
-import sys
 from contextlib import redirect_stderr
-from itertools import accumulate, chain, filterfalse
+from functools import cache
+from itertools import chain
 from pathlib import Path
 from string import ascii_lowercase
 from time import perf_counter
@@ -17,7 +17,14 @@ from isort.api import place_module
 
 from rattr import error
 from rattr.analyser.exc import RattrResultsError
-from rattr.ast.types import AstComprehensions, AstLiterals, AstNodeWithName
+from rattr.ast.types import (
+    AstComprehensions,
+    AstFunctionDef,
+    AstLiterals,
+    AstNodeWithName,
+    AstUnpackable,
+)
+from rattr.ast.util import is_call_to_python_attr_access_fn
 from rattr.config import Config
 from rattr.extra import DictChanges  # noqa: F401
 from rattr.models.ir import FunctionIr
@@ -30,7 +37,7 @@ from rattr.models.symbol import (
     Import,
     Name,
 )
-from rattr.module_locator.util import find_module_spec_fast
+from rattr.module_locator.util import RE_PIP_INSTALL_LOCATIONS, find_module_spec_fast
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
@@ -44,6 +51,14 @@ if TYPE_CHECKING:
 
 re_rattr_name: Final = re.compile(r"^[A-Za-z_][\w\(\)\[\]\.]*$")
 
+_builtin_names: Final = frozenset(dir(builtins))
+_python_builtins: Final = frozenset(PYTHON_BUILTINS)
+
+# Python 3.8+ represents all constants as `ast.Constant`
+_constant_method_prefix: Final = (
+    f"{Config.LITERAL_VALUE_PREFIX}{ast.Constant.__name__}."
+)
+
 
 def get_basename_fullname_pair(
     node: ast.expr,
@@ -83,43 +98,40 @@ def get_basename_fullname_pair(
     NOTE Deprecated, see rattr.ast.util.names_of
 
     """
-    config = Config()
-
-    # Base case
-    # ast.Name ⊂ StrictlyNameable
-    if isinstance(node, ast.Name):
-        return node.id, node.id
-
-    # Recursive case
+    # Descend to the innermost node, outermost first
     # node ⊂ ( StrictlyNameable \ { ast.Name } )
-    if isinstance(node, ast.Call):
-        basename, sub_name = get_basename_fullname_pair(node.func, safe)
-    elif isinstance(node, AstNodeWithName):
-        basename, sub_name = get_basename_fullname_pair(node.value, safe)
+    outer: list[ast.expr] = []
 
-    if isinstance(node, ast.Attribute):
-        return basename, f"{sub_name}.{node.attr}"
+    while isinstance(node, AstNodeWithName) and not isinstance(node, ast.Name):
+        outer.append(node)
+        node = node.func if isinstance(node, ast.Call) else node.value
 
-    if isinstance(node, ast.Subscript):
-        return basename, f"{sub_name}[]"
+    # ast.Name ⊂ StrictlyNameable
+    if isinstance(node, ast.Name):
+        basename = fullname = node.id
+    elif safe:
+        basename = fullname = f"{Config.LITERAL_VALUE_PREFIX}{node.__class__.__name__}"
+    else:
+        raise _name_error(node)
 
-    if isinstance(node, ast.Call):
-        if any(is_call_to(attr, node) for attr in PYTHON_ATTR_ACCESS_BUILTINS):
-            return basename, ".".join(get_xattr_obj_name_pair(basename, node))
+    # Build the name back out from the innermost node
+    for node in reversed(outer):
+        if isinstance(node, ast.Attribute):
+            fullname = f"{fullname}.{node.attr}"
+        elif isinstance(node, ast.Subscript):
+            fullname = f"{fullname}[]"
+        elif isinstance(node, ast.Starred):
+            fullname = f"*{fullname}"
+        elif is_call_to_python_attr_access_fn(node):
+            fullname = ".".join(get_xattr_obj_name_pair(basename, node))
+        else:
+            fullname = f"{fullname}()"
 
-        return basename, f"{sub_name}()"
+    return basename, fullname
 
-    if isinstance(node, ast.Starred):
-        return basename, f"*{sub_name}"
 
-    # Error case
+def _name_error(node: ast.expr) -> TypeError:
     # node ⊂ Nameable ^ node ⊄ StrictlyNameable
-    if safe:
-        return (
-            f"{config.LITERAL_VALUE_PREFIX}{node.__class__.__name__}",
-            f"{config.LITERAL_VALUE_PREFIX}{node.__class__.__name__}",
-        )
-
     _error_class: Type[TypeError] = TypeError
     if isinstance(node, ast.UnaryOp):
         _error_class = error.RattrUnaryOpInNameable
@@ -136,7 +148,7 @@ def get_basename_fullname_pair(
     else:
         _error_class = TypeError
 
-    raise _error_class(f"line {node.lineno}: {ast.dump(node)}")
+    return _error_class(f"line {node.lineno}: {ast.dump(node)}")
 
 
 def get_basename(node: ast.expr, safe: bool = False) -> str:
@@ -201,7 +213,7 @@ def unravel_names(
     if isinstance(node, AstNodeWithName):
         return [get_name(node)]
 
-    if isinstance(node, (ast.Tuple, ast.List)):
+    if isinstance(node, AstUnpackable):
         ravelled = [unravel_names(i, get_name=get_name) for i in node.elts]
         return chain.from_iterable(ravelled)
 
@@ -233,7 +245,7 @@ def is_call_to(target: str, node: ast.Call) -> bool:
 
 def has_affect(builtin: str) -> bool:
     """Return `True` if the given builtin can affect accessed attributes."""
-    if builtin not in PYTHON_BUILTINS:
+    if builtin not in _python_builtins:
         raise ValueError(f"'{builtin}' is not a Python builtin")
 
     return builtin in PYTHON_ATTR_ACCESS_BUILTINS
@@ -594,7 +606,12 @@ def is_blacklisted_module(module: str) -> bool:
     if is_stdlib_module(module):
         return False
 
-    return any(re.fullmatch(p, module) for p in config.blacklist_patterns)
+    re_blacklist = config.re_blacklist
+
+    if re_blacklist is None:
+        return any(p.fullmatch(module) for p in config.re_blacklist_patterns)
+
+    return re_blacklist.fullmatch(module) is not None
 
 
 def is_pip_module(module: str) -> bool:
@@ -602,20 +619,17 @@ def is_pip_module(module: str) -> bool:
 
     NOTE Deprecated, see rattr.ast.place
     """
-    pip_install_locations = (".+/site-packages.*",)
-
     spec = find_module_spec_fast(module)
 
     if spec is None or spec.origin is None:
         return False
 
+    # No backslashes, bad windows!
+    origin = spec.origin.replace("\\", "/")
+
     return any(
-        re.fullmatch(
-            pip_install_location,
-            # No backslashes, bad windows!
-            spec.origin.replace("\\", "/"),
-        )
-        for pip_install_location in pip_install_locations
+        pip_install_location.fullmatch(origin) is not None
+        for pip_install_location in RE_PIP_INSTALL_LOCATIONS
     )
 
 
@@ -634,7 +648,7 @@ def is_stdlib_module(module: str) -> bool:
 
 
 def is_in_builtins(name_or_qualified_name: str) -> bool:
-    return name_or_qualified_name in dir(builtins)
+    return name_or_qualified_name in _builtin_names
 
 
 class timer:
@@ -654,15 +668,19 @@ class timer:
 
 
 class read:
-    """Context manager to return file contents and the number of lines."""
+    """Context manager to return the raw file contents and the number of lines.
+
+    The contents are returned as bytes so that they may be given directly to
+    `ast.parse`, which will respect any PEP 263 encoding declaration.
+    """
 
     def __init__(self, file: Path | str) -> None:
         self.file = file
 
-    def __enter__(self) -> tuple[int, str]:
-        with open(self.file, "r") as f:
-            lines = f.readlines()
-        return len(lines) + 1, "".join(lines)
+    def __enter__(self) -> tuple[int, bytes]:
+        with open(self.file, "rb") as f:
+            source = f.read()
+        return len(source.splitlines()) + 1, source
 
     def __exit__(self, *_) -> None:
         pass
@@ -697,7 +715,7 @@ def get_function_body(
     if isinstance(node, ast.Lambda):
         return [node.body]
 
-    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+    if isinstance(node, AstFunctionDef):
         return node.body
 
     raise TypeError(f"line {node.lineno}: {ast.dump(node)}")
@@ -730,7 +748,7 @@ def get_contained_walruses(
     if not walrus_in_rhs(node):
         return list()
 
-    if isinstance(node.value, (ast.Tuple, ast.List)):
+    if isinstance(node.value, AstUnpackable):
         rhs_values = node.value.elts
     else:
         rhs_values = [node.value]
@@ -975,13 +993,10 @@ def module_name_from_file_path(file: Path | str | None) -> str | None:
 
     module = module.strip(".")
 
-    # Get possible module names in relevancy order
+    # Get possible module names in relevancy order, i.e. the well-formed dotted suffixes
+    # from longest to shortest
     parts = module.split(".")
-    dotted_parts = list(chain.from_iterable(zip(parts, ["."] * len(parts))))
-    possible = list(accumulate(reversed(dotted_parts), lambda p0, p1: f"{p1}{p0}"))
-    well_formed = list(filterfalse(lambda p: p.startswith("."), possible))
-    well_formed = list(wf[:-1] for wf in well_formed if len(wf) >= 1)
-    ordered = list(reversed(well_formed))
+    ordered = [".".join(parts[i:]) for i, part in enumerate(parts) if part]
 
     for p in [*ordered, None]:
         if find_module_spec_fast(p) is None:
@@ -1031,58 +1046,54 @@ def get_function_form(node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
 
 def is_excluded_name(name: str) -> bool:
     """Return `True` if the given name is in the exclude list."""
-    config = Config()
-    return any(
-        pattern.fullmatch(name) is not None
-        for pattern in config.arguments.re_excluded_names
-    )
+    arguments = Config().arguments
+    re_excluded_name = arguments.re_excluded_name
 
+    if re_excluded_name is None:
+        return any(p.fullmatch(name) for p in arguments.re_excluded_names)
 
-def is_method_on_constant(name: str) -> bool:
-    """Return `True` if the name is a call to method on a constant."""
-    if sys.version_info.major == 3 and sys.version_info.minor <= 7:
-        return name.startswith(
-            (
-                "@Num.",
-                "@Str.",
-                "@Bytes.",
-                "@NameConstant.",
-            )
-        )
-
-    if sys.version_info.major == 3 and sys.version_info.minor >= 8:
-        return name.startswith("@Constant.")
+    return re_excluded_name.fullmatch(name) is not None
 
-    raise NotImplementedError
 
+def is_method_on_constant(name: str) -> bool:
+    """Return `True` if the name is a call to method on a constant."""
+    return name.startswith(_constant_method_prefix)
 
-def is_method_on_cast(name: str) -> bool:
-    """Return `True` if the name is a call to a method on a cast."""
-    # NOTE All builtin functions return primitives (often `None`), ...
-    builtins = {b for b in PYTHON_BUILTINS if b.startswith((*ascii_lowercase,))}
 
+# NOTE All builtin functions return primitives (often `None`), ...
+_primitive_returning_builtins: Final = frozenset(
+    b for b in PYTHON_BUILTINS if b.startswith((*ascii_lowercase,))
+).difference(
     # NOTE ... with the following exceptions
-    builtins = builtins.difference(
-        {
-            "eval",
-            "exec",
-            "getattr",
-            "iter",
-            "next",
-            "slice",
-            "super",
-            "type",
-        }
+    {
+        "eval",
+        "exec",
+        "getattr",
+        "iter",
+        "next",
+        "slice",
+        "super",
+        "type",
+    }
+)
+
+# NOTE
+#   Direct call to `<primitive_returner>.method_name()`, do not allow call
+#   to call, etc because one may return non-primitive
+re_method_on_cast: Final = re.compile(
+    "(?:{})\\(\\)\\.[^\\(\\)\\[\\]\\.]+".format(
+        "|".join(re.escape(b) for b in sorted(_primitive_returning_builtins))
     )
+)
 
-    # NOTE
-    #   Direct call to `<primitive_returner>.method_name()`, do not allow call
-    #   to call, etc because one may return non-primitive
-    patterns = tuple((f"{b}\\(\\)\\.[^\\(\\)\\[\\]\\.]+" for b in builtins))
 
-    return any(re.fullmatch(p, name) for p in patterns)
+@cache
+def is_method_on_cast(name: str) -> bool:
+    """Return `True` if the name is a call to a method on a cast."""
+    return re_method_on_cast.fullmatch(name) is not None
 
 
+@cache
 def is_method_on_primitive(name: str) -> bool:
     """Return `True` if the given name is a method on a primitive type."""
     if is_method_on_constant(name):
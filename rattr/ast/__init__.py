@@ -5,6 +5,7 @@ from .types import (
     AstFunctionDef,
     AstFunctionDefOrLambda,
     AstLiterals,
+    AstUnpackable,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "AstFunctionDef",
     "AstFunctionDefOrLambda",
     "AstLiterals",
+    "AstUnpackable",
 ]
@@ -13,9 +13,14 @@ from rattr.config import Config
 from rattr.models.symbol._symbols import PYTHON_ATTR_ACCESS_BUILTINS
 
 if TYPE_CHECKING:
+    from typing import Final
+
     from rattr.ast.types import Identifier
 
 
+_PYTHON_ATTR_ACCESS_BUILTINS: Final = frozenset(PYTHON_ATTR_ACCESS_BUILTINS)
+
+
 def is_call_to_fn(node: ast.Call, target: Identifier) -> bool:
     """Return `True` if the given node is a direct call to `target`."""
     if not isinstance(node, ast.Call):
@@ -27,6 +32,17 @@ def is_call_to_fn(node: ast.Call, target: Identifier) -> bool:
     return node.func.id == target
 
 
+def is_call_to_python_attr_access_fn(node: ast.Call) -> bool:
+    """Return `True` if the given node is a direct call to `getattr`, etc."""
+    if not isinstance(node, ast.Call):
+        raise TypeError(f"line {node.lineno}: {ast.dump(node)}")
+
+    if not isinstance(node.func, ast.Name):
+        return False
+
+    return node.func.id in _PYTHON_ATTR_ACCESS_BUILTINS
+
+
 def is_string_literal(node: ast.expr) -> bool:
     return isinstance(node, ast.Constant) and isinstance(node.value, str)
 
@@ -147,9 +163,7 @@ def names_of(
 @lru_cache(maxsize=1)
 def __safe_name(node: ast.expr) -> Identifier:
     """Return a safe name for this unnameable expression."""
-    config = Config()
-
-    _local_value_prefix = config.LITERAL_VALUE_PREFIX
+    _local_value_prefix = Config.LITERAL_VALUE_PREFIX
     _node_class_name = node.__class__.__name__
 
     return f"{_local_value_prefix}{_node_class_name}"
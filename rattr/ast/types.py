@@ -28,6 +28,13 @@ AstComprehensions = (
 """AST nodes which represent comprehensions."""
 
 
+AstUnpackable = (
+    ast.Tuple,
+    ast.List,
+)
+"""AST nodes which may be the target or value of iterable unpacking."""
+
+
 AstFunctionDef = (
     ast.FunctionDef,
     ast.AsyncFunctionDef,
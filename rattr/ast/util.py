@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import ast
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from rattr.ast._util import (  # noqa: F401
     get_python_attr_access_fn_obj_attr_pair,  # type: ignore[reportUnusedImport]
     is_call_to_fn,  # type: ignore[reportUnusedImport]
+    is_call_to_python_attr_access_fn,  # type: ignore[reportUnusedImport]
     is_string_literal,  # type: ignore[reportUnusedImport]
     names_of,
 )
-from rattr.ast.types import AstNodeWithName
+from rattr.ast.types import AstNodeWithName, AstUnpackable
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -90,7 +91,7 @@ def unravel_names(
     if isinstance(node, AstNodeWithName):
         return [_get_name(node)]
 
-    if isinstance(node, (ast.Tuple, ast.List)):
+    if isinstance(node, AstUnpackable):
         return [
             name
             for elt in node.elts
@@ -148,7 +149,7 @@ def assignment_is_one_to_one(
     targets = assignment_targets(assignment)
 
     def _is_iterable(target: ast.expr | None) -> bool:
-        return isinstance(target, (ast.Tuple, ast.List))
+        return isinstance(target, AstUnpackable)
 
     lhs_is_singular = len(targets) == 1 and not _is_iterable(targets[0])
     rhs_is_singular = not _is_iterable(assignment.value)
@@ -162,7 +163,7 @@ def has_lambda_in_rhs(
     """Return `True` if the given assignment has a lambda in the right-hand side."""
     if isinstance(assignment.value, ast.Lambda):
         return True
-    elif isinstance(assignment.value, (ast.Tuple, ast.List)):  # iterable unpacking
+    elif isinstance(assignment.value, AstUnpackable):  # iterable unpacking
         return any(isinstance(v, ast.Lambda) for v in assignment.value.elts)
     else:
         return False
@@ -174,7 +175,7 @@ def has_walrus_in_rhs(
     """Return `True` if the given assignment contains a walrus assignment in the rhs."""
     if isinstance(assignment.value, ast.NamedExpr):
         return True
-    elif isinstance(assignment.value, (ast.Tuple, ast.List)):
+    elif isinstance(assignment.value, AstUnpackable):
         return any(isinstance(v, ast.NamedExpr) for v in assignment.value.elts)
     else:
         return False
@@ -194,7 +195,7 @@ def walruses_in_rhs(
     if not has_walrus_in_rhs(assignment):
         return []
 
-    if isinstance(assignment.value, (ast.Tuple, ast.List)):
+    if isinstance(assignment.value, AstUnpackable):
         values = assignment.value.elts
     else:
         values = [assignment.value]
@@ -206,19 +207,11 @@ def has_namedtuple_declaration_in_rhs(
     assignment: ast.Assign | ast.AnnAssign | ast.AugAssign | ast.NamedExpr,
 ) -> bool:
     """Return `True` if the rhs contains a call to create a namedtuple type."""
-
-    def _target_is_namedtuple(call: ast.Call) -> bool:
-        # HACK
-        # Naive approach, replace when enum / class namedtuple / etc is improved.
-        # See: cls.py::is_enum, cls.py::is_namedtuple
-        name = fullname_of(call.func, safe=True)
-        return name == "namedtuple" or name.endswith(".namedtuple")
-
     if isinstance(assignment.value, ast.Call):
-        return _target_is_namedtuple(assignment.value)
-    elif isinstance(assignment.value, (ast.Tuple, ast.List)):
+        return _is_call_to_namedtuple(assignment.value)
+    elif isinstance(assignment.value, AstUnpackable):
         return any(
-            _target_is_namedtuple(value)
+            _is_call_to_namedtuple(value)
             for value in assignment.value.elts
             if isinstance(value, ast.Call)
         )
@@ -226,6 +219,51 @@ def has_namedtuple_declaration_in_rhs(
         return False
 
 
+def _is_call_to_namedtuple(call: ast.Call) -> bool:
+    # HACK
+    # Naive approach, replace when enum / class namedtuple / etc is improved.
+    # See: cls.py::is_enum, cls.py::is_namedtuple
+    name = fullname_of(call.func, safe=True)
+    return name == "namedtuple" or name.endswith(".namedtuple")
+
+
+class RhsSummary(NamedTuple):
+    has_lambda: bool
+    has_namedtuple_declaration: bool
+    walruses: list[ast.NamedExpr]
+
+
+def summarise_rhs(
+    assignment: ast.Assign | ast.AnnAssign | ast.AugAssign | ast.NamedExpr,
+) -> RhsSummary:
+    """Return the lambdas, namedtuple declarations, and walruses in the rhs.
+
+    Equivalent to `has_lambda_in_rhs`, `has_namedtuple_declaration_in_rhs`, and
+    `walruses_in_rhs` but in a single pass over the rhs.
+
+    >>> summarise_rhs(ast.parse("a = (b := c), lambda: 1").body[0])
+    RhsSummary(has_lambda=True, has_namedtuple_declaration=False, walruses=[...])
+    """
+    if isinstance(assignment.value, AstUnpackable):
+        values = assignment.value.elts
+    else:
+        values = [assignment.value]
+
+    has_lambda = False
+    has_namedtuple_declaration = False
+    walruses: list[ast.NamedExpr] = []
+
+    for value in values:
+        if isinstance(value, ast.Lambda):
+            has_lambda = True
+        elif isinstance(value, ast.NamedExpr):
+            walruses.append(value)
+        elif isinstance(value, ast.Call) and not has_namedtuple_declaration:
+            has_namedtuple_declaration = _is_call_to_namedtuple(value)
+
+    return RhsSummary(has_lambda, has_namedtuple_declaration, walruses)
+
+
 def namedtuple_init_signature_from_declaration(
     assignment: ast.Assign | ast.AnnAssign | ast.AugAssign | ast.NamedExpr,
 ) -> list[str]:
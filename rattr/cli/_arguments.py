@@ -19,6 +19,7 @@ def add_common_arguments(parser: ArgumentParser) -> ArgumentParser:
     parser = add_warning_level_argument(parser)
     parser = add_format_path_arguments(parser)
     parser = add_permissiveness_arguments(parser)
+    parser = add_jobs_argument(parser)
     parser = add_force_cache_refresh_argument(parser)
     parser = add_stdout_arguments(parser)
 
@@ -234,6 +235,31 @@ def add_permissiveness_arguments(parser: ArgumentParser) -> ArgumentParser:
     return parser
 
 
+def add_jobs_argument(parser: ArgumentParser) -> ArgumentParser:
+    jobs_group = parser.add_argument_group()
+    jobs_group.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        type=int,
+        help=multi_paragraph_wrap(
+            """\
+            set the number of processes used to analyse imports
+            \033[1m(default: --jobs 1)\033[0m
+
+            >NB: requires the 'fork' start method, otherwise imports are analysed in
+            >a single process
+
+            >TOML example: jobs=4
+            """
+        ),
+        metavar="N",
+        dest="jobs",
+    )
+
+    return parser
+
+
 def add_force_cache_refresh_argument(parser: ArgumentParser) -> ArgumentParser:
     stdout_group = parser.add_argument_group()
     stdout_group.add_argument(
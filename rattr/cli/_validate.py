@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import multiprocessing
 from typing import TYPE_CHECKING
 
 from rattr import error
@@ -20,6 +21,13 @@ def validate_arguments(arguments: Arguments) -> Arguments | NoReturn:
     if arguments.threshold < 0:
         error.fatal("threshold must be a positive integer")
 
+    if arguments.jobs < 1:
+        error.fatal("jobs must be a positive integer")
+
+    if arguments.jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        error.rattr("--jobs requires the 'fork' start method, ignoring jobs")
+        arguments.jobs = 1
+
     if not arguments.target.is_file():
         error.fatal(f"file {str(arguments.target)!r} does not exist")
 
@@ -43,6 +43,7 @@ TOML_ARGUMENT_TYPE_MAP: dict[str, TomlArgumentType] = {
     "truncate-deep-paths": TomlArgumentType.flag,
     "strict": TomlArgumentType.flag,
     "threshold": TomlArgumentType.int,
+    "jobs": TomlArgumentType.int,
     "stdout": TomlArgumentType.string,
 }
 """The expected type of the arguments in the toml config file.
@@ -23,6 +23,27 @@ def _cached_re_compile(pattern: str) -> re.Pattern[str]:
     return re.compile(pattern)
 
 
+# Global inline flags apply to the whole expression, and group references are numbered
+# across the whole expression, thus neither keeps its meaning within an alternation
+_re_not_alternable = re.compile(r"\(\?[aiLmsux]+\)|\\[1-9]|\(\?P=|\(\?\(")
+
+
+@lru_cache(maxsize=32)
+def _cached_re_compile_alternation(patterns: frozenset[str]) -> re.Pattern[str] | None:
+    """Return the patterns compiled into a single alternation, if it is equivalent.
+
+    `None` is returned if there are no patterns, or if any pattern would not match as
+    it does on its own, in which case the patterns must be matched separately.
+    """
+    if not patterns or any(_re_not_alternable.search(p) for p in patterns):
+        return None
+
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in sorted(patterns)))
+    except re.error:
+        return None
+
+
 class FollowImports(IntFlag):
     local = auto()
     pip = auto()
@@ -69,6 +90,8 @@ class Arguments(argparse.Namespace):
     is_strict: bool
     threshold: int
 
+    jobs: int
+
     stdout: Output
 
     force_refresh_cache: bool
@@ -116,6 +139,15 @@ class Arguments(argparse.Namespace):
     def re_excluded_names(self) -> tuple[re.Pattern[str], ...]:
         return tuple(_cached_re_compile(p) for p in self.excluded_names)
 
+    @property
+    def re_excluded_name(self) -> re.Pattern[str] | None:
+        """The excluded name patterns compiled into a single alternation.
+
+        If `None`, there are no patterns or they can not be combined, and
+        `re_excluded_names` must be matched instead.
+        """
+        return _cached_re_compile_alternation(frozenset(self.excluded_names))
+
     @property
     def show_warnings(self) -> ShowWarnings:
         if self._warning_level == "none":
@@ -241,6 +273,10 @@ class Config(metaclass=ConfigMetaclass):
     def root_cache_dir(self) -> Path:
         return self.project_root / ".rattr" / "cache"
 
+    @cached_property
+    def home(self) -> str:
+        return str(Path.home().resolve())
+
     @property
     def is_in_target_file(self) -> bool:
         return self.arguments.target == self.state.current_file
@@ -287,7 +323,7 @@ class Config(metaclass=ConfigMetaclass):
         if isinstance(path, str):
             path = Path(path)
 
-        home = str(Path.home().resolve())
+        home = self.home
 
         if path.is_relative_to(self.project_root):
             path = path.relative_to(self.project_root)
@@ -329,3 +365,12 @@ class Config(metaclass=ConfigMetaclass):
     @property
     def re_blacklist_patterns(self) -> tuple[re.Pattern[str], ...]:
         return tuple(_cached_re_compile(p) for p in self.blacklist_patterns)
+
+    @property
+    def re_blacklist(self) -> re.Pattern[str] | None:
+        """The blacklist patterns compiled into a single alternation.
+
+        If `None`, the patterns can not be combined and `re_blacklist_patterns` must be
+        matched instead.
+        """
+        return _cached_re_compile_alternation(frozenset(self.blacklist_patterns))
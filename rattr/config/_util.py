@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import multiprocessing
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -57,6 +58,13 @@ def validate_arguments(arguments: Arguments) -> Arguments:
     if arguments.threshold < 0:
         error.fatal("threshold must be a positive integer")
 
+    if arguments.jobs < 1:
+        error.fatal("jobs must be a positive integer")
+
+    if arguments.jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        error.rattr("--jobs requires the 'fork' start method, ignoring jobs")
+        arguments.jobs = 1
+
     if not arguments.target.is_file():
         error.fatal(f"file {str(arguments.target)!r} does not exist")
 
@@ -132,14 +132,11 @@ def __file_info(culprit: ast.AST | Symbol | None) -> str:
     from rattr.models.symbol import Symbol
 
     config = Config()
-    current_file = config.formatted_current_file_path
 
     if isinstance(culprit, Symbol) and (location := culprit.location) is not None:
         file = config.get_formatted_path(location.file)
-    elif current_file:
-        file = current_file
     else:
-        file = config.formatted_target_path
+        file = config.formatted_current_file_path or config.formatted_target_path
 
     if file is None:
         file = ""  # never
@@ -3,8 +3,9 @@ from __future__ import annotations
 import ast
 from collections.abc import MutableMapping
 from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, NamedTuple, Union
 
 import attrs
 from attrs import field
@@ -37,16 +38,25 @@ from rattr.module_locator.util import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Container, Iterable, Iterator
+    from collections.abc import Callable, Container, Iterable, Iterator
     from typing import Protocol, TypeVar
 
     from rattr.models.symbol._types import CallableSymbol
+    from rattr.versioning.typing import TypeAlias
 
     class ContainerWithContext(Protocol):
         context: Context
 
     SymbolType = TypeVar("SymbolType", bound=Symbol)
 
+    Diagnostic: TypeAlias = Callable[[], None]
+
+
+class CallTargetResolution(NamedTuple):
+    target: CallableSymbol | None
+    diagnostic: Diagnostic | None
+    """The deferred warning, if any, see `Context.resolve_call_target`."""
+
 
 @contextmanager
 def new_context(container: ContainerWithContext) -> Iterator[None]:
@@ -173,44 +183,63 @@ class Context(MutableMapping[Identifier, Symbol]):
         Returns:
             CallableSymbol | None: The callable symbol.
         """
+        target, diagnostic = self.resolve_call_target(callee, culprit)
+
+        if warn and diagnostic is not None:
+            diagnostic()
+
+        return target
+
+    def resolve_call_target(
+        self,
+        callee: Identifier,
+        culprit: ast.AST,
+    ) -> CallTargetResolution:
+        """Return the target of the given call and the deferred warning, if any.
+
+        Unlike `get_call_target`, the warning is not given but returned s.t. a caller
+        may inspect the target before deciding whether-or-not to give it, without
+        resolving the target a second time.
+        """
         canonical = with_call_brackets(callee)
-        _error = f"unable to resolve call to {canonical!r}, {{reason}}"
+
+        def diagnostic(handler: Callable[..., None], reason: str) -> Diagnostic:
+            return partial(
+                handler,
+                f"unable to resolve call to {canonical!r}, {reason}",
+                culprit=culprit,
+            )
 
         name = without_call_brackets(callee).replace("*", "")
         (lhs_name, *_) = name.split(".")
 
         if is_call_to_literal(name):
-            if warn:
-                error.info(
-                    _error.format(reason="target lhs is a literal"),
-                    culprit=culprit,
-                )
-            return None
+            return CallTargetResolution(
+                None,
+                diagnostic(error.info, "target lhs is a literal"),
+            )
 
         if is_call_to_subscript_item(name):
-            if warn:
-                if "." in name:
-                    error.info(
-                        _error.format(reason="target lhs is run-time dependent"),
-                        culprit=culprit,
-                    )
-                else:
-                    error.error(
-                        _error.format(reason="target is run-time dependent"),
-                        culprit=culprit,
-                    )
-            return None
+            if "." in name:
+                return CallTargetResolution(
+                    None,
+                    diagnostic(error.info, "target lhs is run-time dependent"),
+                )
+            return CallTargetResolution(
+                None,
+                diagnostic(error.error, "target is run-time dependent"),
+            )
 
         target = self.get(name)
         lhs_target = self.get(lhs_name)
 
         if is_call_to_method(target, name, lhs_target, lhs_name):
-            if warn and not is_call_to_method_on_py_type(name):
-                error.info(
-                    _error.format(reason="target is a method"),
-                    culprit=culprit,
-                )
-            return target
+
+            def method_diagnostic() -> None:
+                if not is_call_to_method_on_py_type(name):
+                    diagnostic(error.info, "target is a method")()
+
+            return CallTargetResolution(target, method_diagnostic)
 
         # Check for calls to members of imported modules, i.e. the second case below:
         #   `from math import pi`   ->  pi is in context, already resolved above
@@ -218,57 +247,50 @@ class Context(MutableMapping[Identifier, Symbol]):
         if is_call_to_member_of_module_import(name, target):
             target = self._get_target_in_imported_module(name)
 
-        _target_is_callable = target is not None and target.is_callable
-
         # Give warnings for unresolvable targets
         if target is None:
             if is_call_to_method_on_imported_member(target, name, lhs_target, lhs_name):
-                return None
-            if warn:
-                error.warning(
-                    _error.format(reason="target is undefined"),
-                    culprit=culprit,
-                )
-            return None
+                return CallTargetResolution(None, None)
+            return CallTargetResolution(
+                None,
+                diagnostic(error.warning, "target is undefined"),
+            )
 
         if is_call_to_call_result(culprit):
-            if warn:
-                error.error(
-                    _error.format(reason="target is a call on a call"),
-                    culprit=culprit,
-                )
-            return target
+            return CallTargetResolution(
+                target,
+                diagnostic(error.error, "target is a call on a call"),
+            )
 
         # Give warnings for targets likely to be resolved incorrectly
         # TODO On method support, upgrade info to warning
-        if not _target_is_callable:
-            if warn:
-                if target is not None:
-                    if "." not in name and self.declares(target.name):
-                        error.error(
-                            _error.format(
-                                reason="target is likely a procedural parameter",
-                            ),
-                            culprit=culprit,
-                        )
-                    elif "." in target.name:
-                        error.info(
-                            _error.format(reason="target is a method"),
-                            culprit=culprit,
-                        )
-                    else:
-                        error.error(
-                            _error.format(reason="target is not callable"),
-                            culprit=culprit,
-                        )
+        if not target.is_callable:
+
+            def not_callable_diagnostic() -> None:
+                if "." not in name and self.declares(target.name):
+                    reason = "target is likely a procedural parameter"
+                    diagnostic(error.error, reason)()
+                elif "." in target.name:
+                    diagnostic(error.info, "target is a method")()
                 else:
-                    error.error(
-                        _error.format(reason="target is not callable"),
-                        culprit=culprit,
-                    )
-            return target
+                    diagnostic(error.error, "target is not callable")()
 
-        return target
+            return CallTargetResolution(target, not_callable_diagnostic)
+
+        return CallTargetResolution(target, None)
+
+    def snapshot(self) -> Context:
+        """Return a copy of this context (and its ancestors) which may be mutated.
+
+        Symbols are immutable thus only the symbol tables need be copied, this is much
+        cheaper than `copy.deepcopy(context)`.
+        """
+        if self.parent is None:
+            parent = None
+        else:
+            parent = self.parent.snapshot()
+
+        return Context(parent, symbol_table=self.symbol_table.copy(), file=self.file)
 
     # TODO Note to self: I don't like this method name, change it!
     def declares(self, id: Identifier) -> bool:
@@ -302,7 +324,12 @@ class Context(MutableMapping[Identifier, Symbol]):
     # ================================================================================ #
 
     def add_identifiers_to_context(self, assignment: ast.expr) -> None:
-        self.add(Name(name, token=assignment) for name in unravel_names(assignment))
+        # Names already in scope would not be re-added, so do not construct their symbols
+        self.add(
+            Name(name, token=assignment)
+            for name in unravel_names(assignment)
+            if name not in self
+        )
 
     def remove_identifiers_from_context(self, assignment: ast.expr) -> None:
         self.remove(unravel_names(assignment))
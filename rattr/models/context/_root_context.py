@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import ast
-from typing import TYPE_CHECKING
+from functools import cache
+from typing import TYPE_CHECKING, ClassVar
 
 import attrs
 
@@ -39,7 +40,8 @@ from rattr.module_locator.util import (
 )
 
 if TYPE_CHECKING:
-    from typing import Final
+    from collections.abc import Callable
+    from typing import Any, Final
 
     from rattr.ast.types import Identifier
     from rattr.module_locator.util import ModuleName
@@ -73,7 +75,7 @@ def compile_root_context(module: ast.Module) -> Context:
     # Add the Python default names/builtins with dummy tokens (for a consistent symbol
     # interface).
     root.add([__module_level_name(name) for name in MODULE_LEVEL_DUNDER_ATTRS])
-    root.add([__module_level_builtin(name) for name in PYTHON_BUILTINS])
+    root.symbol_table.add(builtin_prelude())
 
     # Populate the context with the top-level declarations
     _root_context_builder = RootContextBuilder(context=root)
@@ -82,7 +84,19 @@ def compile_root_context(module: ast.Module) -> Context:
     return root
 
 
+@cache
+def builtin_prelude() -> tuple[Builtin, ...]:
+    """Return the symbols for the Python builtins, shared by every root context.
+
+    Unlike the module level dunder attrs, the builtins are not located in the current
+    file and as symbols are immutable they can be safely shared between contexts.
+    """
+    return tuple(__module_level_builtin(name) for name in PYTHON_BUILTINS)
+
+
 class RootContextBuilder:
+    _visitors: ClassVar[dict[type[ast.AST], Callable[[Any, Any], None] | None]] = {}
+
     def __init__(self, context: Context) -> None:
         self.context: Context = context
         super().__init__()
@@ -96,13 +110,20 @@ class RootContextBuilder:
         # `ast.NodeVisitor` as we only want to visit the top-level (i.e. not statements
         # in function or class definitions) statements not every
         # node at every depth.
-        visit_method_name = f"visit_{node.__class__.__name__}"
-        visit = getattr(self, visit_method_name, None)
+        # As in `rattr.analyser.base.NodeVisitor`, the registration method is resolved
+        # once per node type rather than once per statement.
+        node_type = type(node)
+
+        try:
+            visit = self._visitors[node_type]
+        except KeyError:
+            visit = getattr(type(self), f"visit_{node_type.__name__}", None)
+            self._visitors[node_type] = visit
 
         if visit is None:
             return
 
-        return visit(node)
+        return visit(self, node)
 
     def register_stmts(self, *stmts: ast.stmt) -> None:
         for stmt in stmts:
@@ -314,8 +335,7 @@ class RootContextBuilder:
                     if len(diff.added) == 1 and node.value == walrus:
                         inner_rhs = list(diff.added)[0]
                         outer_lhs = attrs.evolve(
-                            inner_rhs,
-                            name=fullname_of(assignment_targets(node)[0]),
+                            inner_rhs, name=fullname_of(targets[0])
                         )
                         self.context.add(outer_lhs)
                     elif len(diff.added) > 1:
@@ -48,6 +48,15 @@ class SymbolTable(MutableMapping[Identifier, Symbol]):
         for t in targets:
             del self[t if isinstance(t, Identifier) else t.id]
 
+    def copy(self) -> SymbolTable:
+        """Return a shallow copy of the symbol table.
+
+        As symbols are immutable, the copy is independent of the original.
+        """
+        symbol_table = SymbolTable()
+        symbol_table._symbols = self._symbols.copy()
+        return symbol_table
+
     def pop(self, target: Identifier | Symbol) -> Symbol | None:
         """Return and remove the given target, returns `None` if absent."""
         id = target.id if isinstance(target, Symbol) else target
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+from functools import cache
 from typing import TYPE_CHECKING
 
 from rattr.ast.types import AstLiterals, Identifier
@@ -13,9 +14,26 @@ from rattr.models.symbol._symbols import (
 from rattr.module_locator.util import module_exists
 
 if TYPE_CHECKING:
+    from typing import Final
+
     from rattr.models.symbol._symbol import Symbol
 
 
+_CONSTANT_METHOD_PREFIX: Final = (
+    f"{Config.LITERAL_VALUE_PREFIX}{ast.Constant.__name__}."
+)
+_LITERAL_METHOD_PREFIXES: Final = tuple(
+    f"{Config.LITERAL_VALUE_PREFIX}{literal.__name__}." for literal in AstLiterals
+)
+_PRIMITIVE_RETURNING_CALL_PREFIXES: Final = tuple(
+    prefix
+    for builtin in PYTHON_BUILTINS
+    if builtin[0].isalpha()
+    if builtin not in PYTHON_NON_PRIMITIVE_RETURNING_BUILTINS
+    for prefix in (f"{builtin}.", f"{builtin}().")
+)
+
+
 def is_call_to_literal(name: Identifier) -> bool:
     """Return `True` if this appears to be a call to a literal."""
     return name.startswith("@")
@@ -81,22 +99,12 @@ def is_call_to_member_of_module_import(
 
 def is_direct_call_to_method_on_constant(name: str) -> bool:
     """Return `True` if the name is a call to method on a constant."""
-    config = Config()
-
-    _prefix = config.LITERAL_VALUE_PREFIX
-    _constant = f"{_prefix}{ast.Constant.__name__}."
-
-    return name.startswith(_constant)
+    return name.startswith(_CONSTANT_METHOD_PREFIX)
 
 
 def is_direct_call_to_method_on_literal(name: str) -> bool:
     """Return `True` if the name is a call to method on a constant."""
-    config = Config()
-
-    _prefix = config.LITERAL_VALUE_PREFIX
-    _literals = tuple(f"{_prefix}{literal.__name__}." for literal in AstLiterals)
-
-    return name.startswith(_literals)
+    return name.startswith(_LITERAL_METHOD_PREFIXES)
 
 
 def is_call_to_method_on_primitive_from_call(name: str) -> bool:
@@ -105,12 +113,10 @@ def is_call_to_method_on_primitive_from_call(name: str) -> bool:
     This will have lots of false-negatives, but it will detect calls to methods on the
     results of casts or other applicable builtins.
     """
-    builtins = {b for b in PYTHON_BUILTINS if b[0].isalpha()}
-    builtins -= PYTHON_NON_PRIMITIVE_RETURNING_BUILTINS
-
-    return any(name.startswith((f"{b}.", f"{b}().")) for b in builtins)
+    return name.startswith(_PRIMITIVE_RETURNING_CALL_PREFIXES)
 
 
+@cache
 def is_call_to_method_on_py_type(name: str) -> bool:
     """Return `True` if the given name is a method on a primitive type."""
     if is_direct_call_to_method_on_constant(name):
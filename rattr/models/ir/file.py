@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 from collections.abc import MutableMapping
 from typing import TYPE_CHECKING
 
@@ -26,8 +25,19 @@ class FileIr(MutableMapping[UserDefinedCallableSymbol, FunctionIr]):
     )
 
     def ir_as_dict(self) -> dict[UserDefinedCallableSymbol, FunctionIr]:
-        """Return a copy of the underlying IR dictionary."""
-        return copy.deepcopy(self._file_ir)
+        """Return a copy of the underlying IR dictionary.
+
+        As symbols are immutable only the dictionaries and sets need be copied.
+        """
+        return {
+            symbol: {
+                "gets": set(ir["gets"]),
+                "sets": set(ir["sets"]),
+                "dels": set(ir["dels"]),
+                "calls": set(ir["calls"]),
+            }
+            for symbol, ir in self._file_ir.items()
+        }
 
     # ================================================================================ #
     # Mutable mapping abstract methods and mixin-overrides
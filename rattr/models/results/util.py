@@ -122,11 +122,12 @@ def target_cache_file_is_up_to_date(
         error.info(f"cache file {str(cache_filepath)} is malformed")
         return False
 
+    # Cheapest checks first, each file is only hashed if all else matches
     return (
-        cache.version == version
+        cache.filepath == target
+        and cache.version == version
         and cache.arguments_hash == make_arguments_hash()
         and cache.plugins_hash == make_plugins_hash()
-        and cache.filepath == target
         and cache.filehash == hash_file_content(target)
         and all(
             import_info.filehash == hash_file_content(import_info.filepath)
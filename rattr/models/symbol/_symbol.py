@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import ast
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple, Union
 
@@ -86,8 +87,10 @@ class CallInterface:
     kwonlyargs: tuple[str, ...] = field(default=(), converter=tuple)
     kwarg: Union[str, None] = field(default=None)
 
-    @property
+    @cached_property
     def all(self) -> tuple[str, ...]:
+        # Cached as the interface is immutable, and this is tested per keyword argument
+        # on each call to the function
         arguments: list[str] = []
 
         arguments += self.posonlyargs
@@ -142,10 +145,10 @@ class CallInterface:
         interface at the point of call.
         """
         return ConsumableCallInterface(
-            posonlyargs=[arg for arg in self.posonlyargs],
-            args=[arg for arg in self.args],
+            posonlyargs=list(self.posonlyargs),
+            args=list(self.args),
             vararg=self.vararg,
-            kwonlyargs=[kwarg for kwarg in self.kwonlyargs],
+            kwonlyargs=list(self.kwonlyargs),
             kwarg=self.kwarg,
         )
 
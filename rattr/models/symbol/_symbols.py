@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Union
 import attrs
 from attrs import field
 
+from rattr.ast.types import AstFunctionDef
 from rattr.codegen import gen_import_from_stmt
 from rattr.models.symbol._symbol import (
     AnyCallInterface,
@@ -60,7 +61,7 @@ PYTHON_NON_PRIMITIVE_RETURNING_BUILTINS: Final = frozenset(
 """Python's builtins may-or-will return a non-primitive."""
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Name(Symbol):
     name: str = field()
     basename: str = field()
@@ -86,7 +87,7 @@ class Name(Symbol):
         return Location.from_ast_token(self.token)
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Builtin(Symbol):
     name: str = field()
 
@@ -114,7 +115,7 @@ class Builtin(Symbol):
         return self.name in PYTHON_ATTR_ACCESS_BUILTINS
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Import(Symbol):
     name: str = field()
     qualified_name: str = field()
@@ -181,7 +182,7 @@ class Import(Symbol):
         return gen_import_from_stmt(module, self.name)
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Func(Symbol):
     name: str = field(converter=without_call_brackets)
 
@@ -217,7 +218,7 @@ class Func(Symbol):
         )
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Class(Symbol):
     name: str = field(converter=without_call_brackets)
 
@@ -270,7 +271,7 @@ class Class(Symbol):
         init_interface = AnyCallInterface()
 
         for stmt in ast_class.body:
-            if not isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if not isinstance(stmt, AstFunctionDef):
                 continue
 
             if stmt.name != "__init__":
@@ -281,7 +282,7 @@ class Class(Symbol):
         return Class(name=ast_class.name, token=ast_class, interface=init_interface)
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Call(Symbol):
     name: str = field(converter=without_call_brackets)
 
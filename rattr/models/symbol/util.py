@@ -46,4 +46,10 @@ def get_basename_from_name(name: str) -> str:
     >>> get_basename_from_name("*my_var.attr.method()")
     "my_var"
     """
-    return without_call_brackets(name).replace("*", "").split(".", maxsplit=1)[0]
+    basename, dot, _ = name.replace("*", "").partition(".")
+
+    # Call brackets can only be trailing on the basename if it is the whole name
+    if dot:
+        return basename
+
+    return without_call_brackets(basename)
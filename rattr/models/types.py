@@ -1,8 +0,0 @@
-from __future__ import annotations
-
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from rattr.versioning.typing import TypeAlias
-
-    FunctionName: TypeAlias = str
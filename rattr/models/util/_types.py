@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, TypedDict
 
 import attrs
 
+from rattr.ast.types import ModuleName
 from rattr.models.ir import FileIr
 
 if TYPE_CHECKING:
@@ -11,7 +12,6 @@ if TYPE_CHECKING:
 
 
 FileName: TypeAlias = str
-ModuleName: TypeAlias = str
 
 ImportIrs: TypeAlias = dict[ModuleName, FileIr]
 
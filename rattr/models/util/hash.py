@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import inspect
+import sys
 from os.path import isfile
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -52,13 +53,21 @@ def hash_file_content(
     *,
     blocksize: int = 2**20,
 ) -> str:
-    """Return the hash of the given file's content."""
+    """Return the hash of the given file's content.
+
+    ### Note
+    On Python 3.11+ the file is hashed by `hashlib.file_digest`, which chooses its own
+    buffer size; `blocksize` only applies to the chunked read used on older versions.
+    """
     hash = hashlib.md5()
 
     if not isfile(filepath):
         return hash.hexdigest()
 
     with open(filepath, "rb") as f:
+        if sys.version_info.major == 3 and sys.version_info.minor >= 11:
+            return hashlib.file_digest(f, "md5").hexdigest()
+
         while True:
             buffer = f.read(blocksize)
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
+from rattr.ast.types import FullyQualifiedName, ModuleName  # noqa: F401
 from rattr.versioning.typing import TypeAlias
 
-ModuleName: TypeAlias = str
-FullyQualifiedName: TypeAlias = str
 ImportLevel: TypeAlias = int
@@ -22,10 +22,11 @@ if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
     from typing import Final
 
-    from rattr.ast.types import FullyQualifiedName, ModuleName
-    from rattr.versioning.typing import TypeAlias
-
-    ImportLevel: TypeAlias = int
+    from rattr.module_locator.types import (
+        FullyQualifiedName,
+        ImportLevel,
+        ModuleName,
+    )
 
 
 RE_PIP_INSTALL_LOCATIONS: Final = (re.compile(r".+/site-packages.*"),)
@@ -262,11 +263,18 @@ def is_in_import_blacklist(name: ModuleName) -> bool:
     # the origin is exactly as given as it may still be blacklisted.
     origins.append(name)
 
+    re_blacklist = config.re_blacklist
+
+    if re_blacklist is None:
+        return any(
+            re_pattern.fullmatch(origin)
+            for origin in origins
+            for re_pattern in config.re_blacklist_patterns
+            if origin is not None
+        )
+
     return any(
-        re_pattern.fullmatch(origin)
-        for origin in origins
-        for re_pattern in config.re_blacklist_patterns
-        if origin is not None
+        re_blacklist.fullmatch(origin) for origin in origins if origin is not None
     )
 
 
@@ -55,6 +55,8 @@ def imports_in_names(
 
 
 class ImportClobberingAssertor(Assertor):
+    READ_ONLY = True
+
     def __init__(self, is_strict: bool = True) -> None:
         super().__init__(is_strict=is_strict)
         self.class_stack: list[str] = []
@@ -57,18 +57,16 @@ def resolve_function(
     if call.symbol.target is None:
         raise ImportError
 
-    error_ = f"unable to resolve call to {call.symbol.target.name!r}"
-
-    if call.caller is not None:
-        error_ = f"{error_} in {call.caller.name!r}"
-
     if is_excluded_name(call.symbol.target.name):
+        error_ = __unable_to_resolve_call(call)
         error.error(f"{error_}, the target matches an exclusion", culprit=call.symbol)
         return None
 
     try:
         target = __resolve_target_and_ir(call, environment=environment)
     except ImportError:
+        error_ = __unable_to_resolve_call(call)
+
         if not is_call_to_method_or_member(call.symbol):
             error_ += ", the target is likely a nested function or @rattr_ignore'd"
             error.error(f"{error_}", culprit=call.symbol)
@@ -84,11 +82,10 @@ def resolve_class_init(
     *,
     environment: IrEnvironment,
 ) -> IrTarget | None:
-    error_ = f"unable to resolve initialiser for {call.symbol.target.name!r}"
-
     try:
         target = __resolve_target_and_ir(call, environment=environment)
     except ImportError:
+        error_ = f"unable to resolve initialiser for {call.symbol.target.name!r}"
         error.error(error_, culprit=call.symbol)
         return None
 
@@ -100,18 +97,17 @@ def resolve_import(
     *,
     environment: IrEnvironment,
 ) -> IrTarget | None:
-    config = Config()
-    arguments = config.arguments
-
-    module_ = f"{target.module_name!r}"
-    error_ = f"ignoring call to {target.name!r} imported from {{loc}}"
-
     if target.module_name is None:
         raise ImportError
 
     if is_in_import_blacklist(target.module_name):
         return None
 
+    arguments = Config().arguments
+
+    module_ = f"{target.module_name!r}"
+    error_ = f"ignoring call to {target.name!r} imported from {{loc}}"
+
     if not arguments.follow_local_imports:
         error.info(error_.format(loc="local module"), culprit=target)
         return None
@@ -132,21 +128,16 @@ def resolve_import(
     local_name = target.name.replace(f"{target.module_name}.", "").removesuffix("()")
     new_target = module_ir.context.get(local_name)
 
-    imported_as_ = (
-        f" (imported as {target.name!r})" if target.name != local_name else ""
-    )
-    unresolved_ = (
-        f"unable to resolve call to {local_name!r} in import {module_}{imported_as_}, "
-        f"{{why}}"
-    )
-
     if isinstance(new_target, (Func, Class)):
         ir = module_ir.get(new_target)
 
         # NOTE
         # If the imported function is ignored then it will have no IR
         if ir is None:
-            error.error(unresolved_.format(why="it is likely ignored"), culprit=target)
+            unresolved_ = __unable_to_resolve_import(
+                target, local_name, "it is likely ignored"
+            )
+            error.error(unresolved_, culprit=target)
             return None
 
         return IrTarget(symbol=new_target, ir=ir)
@@ -155,9 +146,13 @@ def resolve_import(
         return resolve_import(new_target, environment=environment)
 
     if new_target is None and is_call_to_method_or_member(local_name):
-        error.info(unresolved_.format(why="it is a method"), culprit=target)
+        unresolved_ = __unable_to_resolve_import(target, local_name, "it is a method")
+        error.info(unresolved_, culprit=target)
     else:
-        error.error(unresolved_.format(why="it is likely undefined"), culprit=target)
+        unresolved_ = __unable_to_resolve_import(
+            target, local_name, "it is likely undefined"
+        )
+        error.error(unresolved_, culprit=target)
 
     return None
 
@@ -197,21 +192,31 @@ def __resolve_target_and_ir(
     return IrTarget(symbol=symbol, ir=module_ir[symbol])
 
 
+def __unable_to_resolve_call(call: IrCall) -> str:
+    error_ = f"unable to resolve call to {call.symbol.target.name!r}"
+
+    if call.caller is not None:
+        error_ = f"{error_} in {call.caller.name!r}"
+
+    return error_
+
+
+def __unable_to_resolve_import(target: Import, local_name: str, why: str) -> str:
+    imported_as_ = (
+        f" (imported as {target.name!r})" if target.name != local_name else ""
+    )
+    return (
+        f"unable to resolve call to {local_name!r} in import "
+        f"{target.module_name!r}{imported_as_}, {why}"
+    )
+
+
 def __resolve_real_class_target(
     target: Class,
     *,
     environment: IrEnvironment,
 ) -> Class:
-    for symbol in environment.target_ir:
-        if isinstance(symbol, Class) and target.name == symbol.name:
-            return symbol
-
-    for _, import_ir in environment.import_irs.items():
-        for symbol in import_ir:
-            if isinstance(symbol, Class) and target.name == symbol.name:
-                return symbol
-
-    return target
+    return environment.classes.get(target.name, target)
 
 
 def is_call_to_method_or_member(target: Call | Identifier) -> bool:
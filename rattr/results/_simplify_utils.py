@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ast
 import re
+import sys
 from typing import TYPE_CHECKING, TypedDict
 
 from rattr import error
@@ -31,44 +32,34 @@ def construct_call_swaps(func: Func, call: Call) -> dict[Identifier, Identifier]
     # Handle vararg and kwargs
     swaps: dict[Identifier, Identifier] = {}
 
-    # Copy the input args / interface so we can pop to keep track of state
-    interface = func.interface.as_consumable_call_interface()
-    call_args = [a for a in call.args.args]
-    call_kwargs = {k: v for k, v in call.args.kwargs.items()}
+    # The interface and arguments are immutable, the unbound remainder of each is
+    # tracked by slicing
+    interface = func.interface
+    call_args = call.args.args
 
-    while True:
-        if not interface.posonlyargs:
-            break
-
-        if not call_args:
-            error.error(
-                f"call to {func.name!r} expected {len(func.interface.posonlyargs)} "
-                f"posonlyargs but only received {len(call.args.args)} positional "
-                f"arguments",
-                culprit=call,
-            )
-            return {}
-
-        target = interface.posonlyargs.pop(0)
-        replacement = call_args.pop(0)
-
-        swaps[target] = replacement
-
-    while True:
-        if not interface.args:
-            break  # no error as the remaining args may be supplied by kw
+    if len(call_args) < len(interface.posonlyargs):
+        error.error(
+            f"call to {func.name!r} expected {len(func.interface.posonlyargs)} "
+            f"posonlyargs but only received {len(call.args.args)} positional "
+            f"arguments",
+            culprit=call,
+        )
+        return {}
 
-        if not call_args:
-            break
+    swaps.update(zip(interface.posonlyargs, call_args))
+    call_args = call_args[len(interface.posonlyargs) :]
 
-        target = interface.args.pop(0)
-        replacement = call_args.pop(0)
+    # No error if there are too few positional arguments, as the remaining args may be
+    # supplied by keyword
+    bound = min(len(interface.args), len(call_args))
 
-        swaps[target] = replacement
+    swaps.update(zip(interface.args, call_args))
+    remaining_args = set(interface.args[bound:])
+    call_args = call_args[bound:]
 
     if interface.vararg is not None:
         swaps[interface.vararg] = VARARG_NAME
-        call_args = []
+        call_args = ()
 
     # We can't be very specific here as we don't know if any of the positional arguments
     # have defaults (yet, we need a better CallInterface, see the todo above).
@@ -78,21 +69,20 @@ def construct_call_swaps(func: Func, call: Call) -> dict[Identifier, Identifier]
             culprit=call,
         )
 
-    # interface.args may be [] or [...]
-    # call_args is []
+    # remaining_args may be empty or non-empty
+    # call_args is empty
 
     unexpected_keyword_arguments: list[Identifier] = []
     arguments_given_by_position_and_name: list[Identifier] = []
 
-    for target, replacement in call_kwargs.items():
+    # Keywords are unique, so each remaining argument is bound at most once here
+    remaining_kwonlyargs = set(interface.kwonlyargs)
+
+    for target, replacement in call.args.kwargs.items():
         if target in swaps:
             arguments_given_by_position_and_name.append(target)
 
-        if target in interface.args:
-            interface.args.remove(target)
-            swaps[target] = replacement
-        elif target in interface.kwonlyargs:
-            interface.kwonlyargs.remove(target)
+        if target in remaining_args or target in remaining_kwonlyargs:
             swaps[target] = replacement
         elif interface.kwarg is not None:
             swaps[interface.kwarg] = KWARGS_NAME
@@ -113,7 +103,7 @@ def construct_call_swaps(func: Func, call: Call) -> dict[Identifier, Identifier]
             culprit=call,
         )
 
-    # There could be interface.args remaining but for now we don't know if they might
+    # There could be remaining_args but for now we don't know if they might
     # be defaulted so we can't do anything here
     # There could also be interface.kwonlyargs but, likewise, they could have defaults
 
@@ -124,25 +114,56 @@ def unbind_ir_with_call_swaps(
     ir: FunctionIr,
     swaps: dict[Identifier, Identifier],
 ) -> FunctionIr:
+    # Commonly the callee has no arguments to swap, thus nothing to unbind
+    if not swaps:
+        return {**ir}
+
+    # A name is often in more than one of gets, sets, and dels, thus unbind it once
+    unbound_names: dict[Name, Name] = {}
+
     return {
-        "gets": {unbind_name(n, swaps.get(n.basename, n.basename)) for n in ir["gets"]},
-        "sets": {unbind_name(n, swaps.get(n.basename, n.basename)) for n in ir["sets"]},
-        "dels": {unbind_name(n, swaps.get(n.basename, n.basename)) for n in ir["dels"]},
+        "gets": __unbind_names(ir["gets"], swaps, unbound_names),
+        "sets": __unbind_names(ir["sets"], swaps, unbound_names),
+        "dels": __unbind_names(ir["dels"], swaps, unbound_names),
         "calls": ir["calls"],
     }
 
 
+def __unbind_names(
+    names: set[Name],
+    swaps: dict[Identifier, Identifier],
+    unbound_names: dict[Name, Name],
+) -> set[Name]:
+    unbound: set[Name] = set()
+    add, get_swap = unbound.add, swaps.get
+
+    for name in names:
+        new_basename = get_swap(name.basename)
+
+        # Most names are not swapped, or are swapped to themselves, i.e. `fn(a)` of
+        # `def fn(a)`, and are kept as is
+        if new_basename is None or new_basename == name.basename:
+            add(name)
+            continue
+
+        if (unbound_name := unbound_names.get(name)) is None:
+            unbound_name = unbound_names[name] = unbind_name(name, new_basename)
+
+        add(unbound_name)
+
+    return unbound
+
+
 def unbind_name(symbol: Name, new_basename: Identifier) -> Name:
     """Return a new symbol bound to the new base name."""
     if symbol.basename == new_basename:
         return symbol
 
-    if symbol.name.startswith("*"):
-        old, new = f"*{symbol.basename}", f"*{new_basename}"
-    else:
-        old, new = symbol.basename, new_basename
+    # The base name is always a prefix of the name, save for a leading star
+    name = symbol.name
+    star = "*" if name.startswith("*") else ""
 
-    if not symbol.name.startswith(old):
+    if not name.startswith(symbol.basename, len(star)):
         # If this is ever true then we'd need to do a regex over:
         # r"^(?P<star>\*)?(?P<basename>\w+)(?P<remainder>(\.\w+)*)(?P<subscript>\[\])?$"
         # constructing a new string from the match groups with basename replaced with
@@ -151,7 +172,8 @@ def unbind_name(symbol: Name, new_basename: Identifier) -> Name:
         # holds.
         raise ValueError("never")
 
-    new_name = symbol.name.replace(old, new, 1)
+    remainder = name[len(star) + len(symbol.basename) :]
+    new_name = sys.intern(star + new_basename + remainder)
     return Name(name=new_name, basename=new_basename, location=symbol.location)
 
 
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from itertools import chain
 from typing import TYPE_CHECKING, NamedTuple
 
+import attrs
+from attrs import field
+
+from rattr.models.symbol import Class
+
 if TYPE_CHECKING:
     from rattr.analyser.types import ImportIrs
     from rattr.models.ir import FileIr, FunctionIr
-    from rattr.models.symbol import Call, Class, Func
+    from rattr.models.symbol import Call, Func
 
 
 class IrTarget(NamedTuple):
@@ -18,10 +24,24 @@ class IrCall(NamedTuple):
     symbol: Call
 
 
-class IrEnvironment(NamedTuple):
+@attrs.frozen
+class IrEnvironment:
     target_ir: FileIr
     import_irs: ImportIrs
 
+    classes: dict[str, Class] = field(init=False, eq=False, repr=False)
+    """The first class of each name in the target, then in the imports."""
+
+    @classes.default
+    def _classes_default(self) -> dict[str, Class]:
+        classes: dict[str, Class] = {}
+
+        for symbol in chain(self.target_ir, *self.import_irs.values()):
+            if isinstance(symbol, Class):
+                classes.setdefault(symbol.name, symbol)
+
+        return classes
+
 
 class IrCallTreeNode(NamedTuple):
     target: IrTarget
@@ -16,7 +16,10 @@ from rattr.results import (
 if TYPE_CHECKING:
     from rattr.analyser.types import ImportIrs
     from rattr.models.ir import FileIr, FunctionIr
-    from rattr.models.symbol import Call
+    from rattr.models.symbol import Call, Location, Symbol
+    from rattr.versioning.typing import TypeAlias
+
+    _CallTargetKey: TypeAlias = tuple[Symbol | None, Location | None]
 
 
 def generate_results_from_ir(
@@ -26,11 +29,16 @@ def generate_results_from_ir(
 ) -> FileResults:
     results = FileResults()
     environment = IrEnvironment(target_ir=target_ir, import_irs=import_irs)
+    call_targets: dict[_CallTargetKey, IrTarget] = {}
 
     for symbol, ir in target_ir.items():
         target = IrTarget(symbol=symbol, ir=ir)
 
-        ir_call_tree = make_target_ir_call_tree(target, environment=environment)
+        ir_call_tree = make_target_ir_call_tree(
+            target,
+            environment=environment,
+            call_targets=call_targets,
+        )
         simplified = destructively_simplify_ir_call_tree(ir_call_tree)
 
         results[symbol.id] = {
@@ -47,9 +55,15 @@ def make_target_ir_call_tree(
     target: IrTarget,
     *,
     environment: IrEnvironment,
+    call_targets: dict[_CallTargetKey, IrTarget] | None = None,
 ) -> IrCallTreeNode:
     """Return the constructed IR call tree stemming from the given target.
 
+    Given `call_targets` the resolved target of each callee is stored therein and
+    reused by later trees in the same environment. Only successful resolutions are
+    stored as they depend only on the callee, whereas failures are reported with
+    respect to the caller.
+
     Implementation:
         BFS the call tree from the root, constructing the nodes and children along the
         way.
@@ -104,6 +118,9 @@ def make_target_ir_call_tree(
         functions, the same for each step in the case of indirect recursion, etc),
         however, those trivially hold given the above and are cumbersome to express.
     """
+    if call_targets is None:
+        call_targets = {}
+
     root = IrCallTreeNode.new(target=target, call=None)
 
     queue = deque([root])
@@ -116,11 +133,19 @@ def make_target_ir_call_tree(
             if call.symbol in seen:
                 continue
 
-            call_target = find_call_target_and_ir(call, environment=environment)
+            # Symbols are equal regardless of location, but equal functions defined in
+            # different modules are distinct targets
+            key = (call.symbol.target, getattr(call.symbol.target, "location", None))
+            call_target = call_targets.get(key)
+
+            if call_target is None:
+                call_target = find_call_target_and_ir(call, environment=environment)
 
             if call_target is None:
                 continue
 
+            call_targets[key] = call_target
+
             child = IrCallTreeNode.new(target=call_target, call=call)
 
             node.children.append(child)
@@ -132,15 +157,13 @@ def make_target_ir_call_tree(
 
 
 def destructively_simplify_ir_call_tree(root: IrCallTreeNode) -> FunctionIr:
-    queue = post_order_traversal_queue(root)
-
-    while queue:
-        node = queue.popleft()
-
+    for node in post_order_traversal_queue(root):
         if not node.children:
             # Leaves are already simplified
             continue
 
+        # Merged one child at a time, as under recursion a child's IR may be that of
+        # the node itself, and so must include the children merged before it
         for child in node.children:
             swaps = construct_call_swaps(child.target.symbol, child.edge_in.symbol)
             unbound = unbind_ir_with_call_swaps(child.target.ir, swaps)
@@ -153,13 +176,11 @@ def destructively_simplify_ir_call_tree(root: IrCallTreeNode) -> FunctionIr:
 
 
 def post_order_traversal_queue(root: IrCallTreeNode) -> deque[IrCallTreeNode]:
-    queue = deque([root])
-    pre_order_queue = list()
+    # Breadth-first, the list is extended with the children of each node as it is
+    # reached, thus reversed every child precedes its parent
+    breadth_first = [root]
 
-    while queue:
-        node = queue.popleft()
-        for child in node.children:
-            queue.append(child)
-        pre_order_queue.append(node)
+    for node in breadth_first:
+        breadth_first.extend(node.children)
 
-    return deque(pre_order_queue[::-1])
+    return deque(reversed(breadth_first))
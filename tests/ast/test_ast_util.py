@@ -18,12 +18,14 @@ from rattr.ast.util import (
     has_namedtuple_declaration_in_rhs,
     has_walrus_in_rhs,
     is_call_to_fn,
+    is_call_to_python_attr_access_fn,
     is_relative_import,
     is_starred_import,
     is_string_literal,
     namedtuple_init_signature_from_declaration,
     names_of,
     parse_space_delimited_ast_string,
+    summarise_rhs,
     unpack_ast_list_of_strings,
     unravel_names,
     walruses_in_rhs,
@@ -75,6 +77,24 @@ class TestIsCallToFn:
         assert is_call_to_fn(call.func.value, "fn")
 
 
+class TestIsCallToPythonAttrAccessFn:
+    @pytest.mark.parametrize("fn", PYTHON_ATTR_ACCESS_BUILTINS)
+    def test_positive_case(self, fn):
+        call = ast.parse(f"{fn}(obj, 'attr')").body[0].value
+        assert is_call_to_python_attr_access_fn(call)
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "fn(obj, 'attr')",
+            "obj.getattr(obj, 'attr')",
+            "getattr(obj, 'attr').method()",
+        ],
+    )
+    def test_negative_case(self, expr):
+        assert not is_call_to_python_attr_access_fn(ast.parse(expr).body[0].value)
+
+
 class TestIsStringLiteral:
     @pytest.mark.parametrize("literal", ["'some_string'", "'1234'", "'True'"])
     def test_constant_positive_case(self, literal):
@@ -402,6 +422,34 @@ def test_has_namedtuple_declaration_in_rhs(expr: str, expected: bool):
     assert has_namedtuple_declaration_in_rhs(ast.parse(expr).body[0]) == expected
 
 
+@pytest.mark.parametrize(
+    "expr",
+    testcases := [
+        "a = 1",
+        "a = 1, 2",
+        "a: SomeType = SomeType()",
+        "a += 1",
+        "a = lambda: 1",
+        "a = 1, lambda: 1",
+        "a = (b := c)",
+        "a = (x := y, m := n)",
+        "a = (b, (c, x := y))",
+        "point = namedtuple('point', ['x', 'y'])",
+        "point = user_extended.namedtuple('point', ['x', 'y'])",
+        "point = noomedtoople('point', ['x', 'y'])",
+        "a, b = f(), namedtuple('p', 'x'), lambda: 1, (c := d)",
+    ],
+    ids=testcases,
+)
+def test_summarise_rhs(expr: str):
+    node = ast.parse(expr).body[0]
+    summary = summarise_rhs(node)
+
+    assert summary.has_lambda == has_lambda_in_rhs(node)
+    assert summary.has_namedtuple_declaration == has_namedtuple_declaration_in_rhs(node)
+    assert summary.walruses == walruses_in_rhs(node)
+
+
 def test_namedtuple_init_signature_from_declaration_not_a_call():
     with pytest.raises(TypeError):
         namedtuple_init_signature_from_declaration(ast.parse("'not_a_call'").body[0])
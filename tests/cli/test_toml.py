@@ -42,6 +42,7 @@ class TestToml:
             collapse_home=False,
             truncate_deep_paths=False,
             is_strict=False,
+            jobs=1,
             stdout=Output.results,
             force_refresh_cache=False,
             cache_file=None,
@@ -89,6 +90,7 @@ class TestToml:
             threshold=8,
             collapse_home=False,
             truncate_deep_paths=False,
+            jobs=1,
             stdout=Output.results,
             force_refresh_cache=False,
             cache_file=None,
@@ -113,6 +115,7 @@ class TestToml:
             collapse_home=False,
             truncate_deep_paths=False,
             is_strict=False,
+            jobs=1,
             stdout=Output.results,
             force_refresh_cache=False,
             cache_file=None,
@@ -138,6 +141,7 @@ class TestToml:
             collapse_home=False,
             truncate_deep_paths=False,
             is_strict=False,
+            jobs=1,
             stdout=Output.results,
             force_refresh_cache=False,
             cache_file=None,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 from functools import partial
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -201,6 +202,76 @@ class TestConfig:
             with arguments(target=file):
                 assert config.formatted_target_path == "~/.../path/to/a.file"
 
+    def test_re_blacklist(self, config, arguments):
+        with arguments(_excluded_imports={r"beelzebub", r"abaddon\..*"}):
+            assert config.re_blacklist.fullmatch("rattr")
+            assert config.re_blacklist.fullmatch("rattr.module_locator")
+            assert config.re_blacklist.fullmatch("beelzebub")
+            assert config.re_blacklist.fullmatch("abaddon.submodule")
+
+            assert not config.re_blacklist.fullmatch("beelzebub.submodule")
+            assert not config.re_blacklist.fullmatch("abaddon")
+            assert not config.re_blacklist.fullmatch("michael")
+
+        assert not config.re_blacklist.fullmatch("beelzebub")
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"(?i)beelzebub", r"(b)eelzebu\1", r"(?P<b>b)eelzebu(?P=b)"],
+    )
+    def test_re_blacklist_is_none_when_not_alternable(
+        self,
+        config,
+        arguments,
+        pattern,
+    ):
+        with arguments(_excluded_imports={pattern}):
+            assert config.re_blacklist is None
+            assert any(p.fullmatch("rattr") for p in config.re_blacklist_patterns)
+
+    def test_re_blacklist_is_cached(self, config, arguments):
+        with arguments(_excluded_imports={r"beelzebub"}):
+            assert config.re_blacklist is config.re_blacklist
+
+    def test_re_excluded_name(self, config, arguments):
+        assert config.arguments.re_excluded_name is None
+
+        with arguments(_excluded_names={r"sin", r"_.*"}):
+            assert config.arguments.re_excluded_name.fullmatch("sin")
+            assert config.arguments.re_excluded_name.fullmatch("_hidden_func")
+
+            assert not config.arguments.re_excluded_name.fullmatch("sine")
+            assert not config.arguments.re_excluded_name.fullmatch("cos")
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"(?i)_private.*", r"(_)private\1", r"(?P<u>_)private(?P=u)"],
+    )
+    def test_re_excluded_name_is_none_when_not_alternable(
+        self,
+        config,
+        arguments,
+        pattern,
+    ):
+        with arguments(_excluded_names={r"sin", pattern}):
+            assert config.arguments.re_excluded_name is None
+            assert len(config.arguments.re_excluded_names) == 2
+
+    def test_re_excluded_name_is_cached(self, config, arguments):
+        with arguments(_excluded_names={r"sin", r"_.*"}):
+            assert (
+                config.arguments.re_excluded_name is config.arguments.re_excluded_name
+            )
+
+    def test_home(self, config):
+        home = str(Path.home().resolve())
+        assert config.home == home
+
+        with mock.patch("pathlib.Path.home") as _home:
+            assert config.home == home
+
+        _home.assert_not_called()
+
 
 class TestGetFormattedPath:
     def test_path_is_none(self, config):
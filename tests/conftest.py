@@ -188,6 +188,7 @@ def _init_testing_config() -> None:
             truncate_deep_paths=True,
             is_strict=False,
             threshold=0,
+            jobs=1,
             stdout=Output.results,
             target=Path("target.py"),
         ),
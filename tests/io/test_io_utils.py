@@ -43,7 +43,7 @@ class TestRead:
         the_file: Path = get_test_file(filename)
 
         with read(the_file) as (number_of_lines, content):
-            assert content == the_file.read_text()
+            assert content == the_file.read_bytes()
             assert number_of_lines == len(the_file.read_text().splitlines()) + 1
 
     @pytest.mark.parametrize("filename", ["foo.py"])
@@ -51,3 +51,11 @@ class TestRead:
         with pytest.raises(FileNotFoundError):
             with read(get_non_existent_file(filename)) as _:
                 ...
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    def test_number_of_lines_is_independent_of_newline(self, tmp_path, newline):
+        the_file = tmp_path / "the_file.py"
+        the_file.write_bytes(newline.join(["a = 1", "b = 2", "c = 3"]).encode())
+
+        with read(the_file) as (number_of_lines, _):
+            assert number_of_lines == 4
@@ -172,6 +172,31 @@ def test_context_get_call_func_target(capfd: pytest.CaptureFixture[str]):
     assert root.get_call_target("a()", culprit=None) == func
 
 
+def test_context_resolve_call_target_defers_diagnostic(
+    capfd: pytest.CaptureFixture[str],
+):
+    root = Context(parent=None)
+
+    target, diagnostic = root.resolve_call_target("anything", culprit=None)
+    assert target is None
+    assert diagnostic is not None
+
+    _, stderr = capfd.readouterr()
+    assert stderr == ""
+
+    diagnostic()
+
+    _, stderr = capfd.readouterr()
+    assert "unable to resolve call to 'anything()', target is undefined" in stderr
+
+
+def test_context_resolve_call_func_target_has_no_diagnostic():
+    root = Context(parent=None)
+    root.add(func := Func(name="a", interface=CallInterface()))
+
+    assert root.resolve_call_target("a()", culprit=None) == (func, None)
+
+
 def test_context_get_call_target_brackets_dont_matter():
     root = Context(parent=None)
     root.add(a := Func(name="a", interface=CallInterface()))
@@ -229,6 +254,23 @@ def test_context_add_identifiers_to_context_multiple():
     }
 
 
+def test_context_add_identifiers_to_context_keeps_existing_symbols():
+    first: ast.Name = ast.parse("a = 1").body[0].targets[0]
+    second: ast.Name = ast.parse("a, b = 2, 3").body[0].targets[0]
+
+    root = Context(parent=None)
+    root.add_identifiers_to_context(first)
+    symbol = root["a"]
+
+    root.add_identifiers_to_context(second)
+
+    assert root["a"] is symbol
+    assert root.symbol_table._symbols == {
+        "a": Name("a", token=first),
+        "b": Name("b", token=second),
+    }
+
+
 def test_context_remove_identifiers_from_context_single():
     expr: ast.Name = ast.parse("del a").body[0].targets[0]
 
@@ -308,3 +350,27 @@ def test_context_redefinition_in_child_scope():
 
     assert root.symbol_table._symbols == {"var_one": Name("var_one")}
     assert child.symbol_table._symbols == {}
+
+
+def test_context_snapshot():
+    root = Context(parent=None)
+    root.add((a := Name("a"), b := Name("b")))
+
+    child = Context(parent=root)
+    child.add(c := Name("c"))
+
+    snapshot = child.snapshot()
+
+    assert snapshot == child
+    assert snapshot.parent == root
+    assert snapshot.symbol_table is not child.symbol_table
+    assert snapshot.parent.symbol_table is not root.symbol_table
+
+    snapshot.parent.remove(a.name)
+    snapshot.remove(c.name)
+    snapshot.add(d := Name("d"))
+
+    assert root.symbol_table._symbols == {a.name: a, b.name: b}
+    assert child.symbol_table._symbols == {c.name: c}
+    assert snapshot.parent.symbol_table._symbols == {b.name: b}
+    assert snapshot.symbol_table._symbols == {d.name: d}
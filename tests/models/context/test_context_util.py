@@ -204,7 +204,12 @@ class TestIsCallToMethodOnPrimitiveFromCall:
 
     @pytest.mark.parametrize(
         "expr",
-        ["my_int.to_bytes()", "my_int().to_bytes()"],
+        [
+            "my_int.to_bytes()",
+            "my_int().to_bytes()",
+            "iter().method()",
+            "type.mro()",
+        ],
     )
     def test_negative_case(self, expr):
         assert not is_call_to_method_on_primitive_from_call(expr)
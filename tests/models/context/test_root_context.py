@@ -7,7 +7,10 @@ from unittest import mock
 import pytest
 
 from rattr.models.context import Context, compile_root_context
-from rattr.models.context._root_context import MODULE_LEVEL_DUNDER_ATTRS
+from rattr.models.context._root_context import (
+    MODULE_LEVEL_DUNDER_ATTRS,
+    builtin_prelude,
+)
 from rattr.models.symbol import CallInterface, Class, Func, Import, Name
 from tests.shared import compare_symbol_table_symbols, match_output
 
@@ -50,6 +53,15 @@ def test_root_context_python_builtins_have_correct_affect_status(root_context: C
     assert setattr_symbol.has_affect
 
 
+def test_root_context_python_builtins_are_shared_between_root_contexts():
+    first = compile_root_context(ast.Module(body=[]))
+    second = compile_root_context(ast.Module(body=[]))
+
+    for builtin in builtin_prelude():
+        assert first.symbol_table[builtin.id] is builtin
+        assert second.symbol_table[builtin.id] is builtin
+
+
 def test_root_context_import(
     parse: ParseFn,
     make_symbol_table: MakeSymbolTableFn,
@@ -78,6 +78,23 @@ class TestSymbolTableAdd:
         assert before == after
 
 
+class TestSymbolTableCopy:
+    def test_copy(self, symbol_table: SymbolTable):
+        copied = symbol_table.copy()
+
+        assert copied == symbol_table
+        assert copied._symbols is not symbol_table._symbols
+
+    def test_copy_is_independent(self, symbol_table: SymbolTable):
+        copied = symbol_table.copy()
+
+        copied.remove("x")
+        copied.add(Name("new_symbol"))
+
+        assert "x" in symbol_table
+        assert "new_symbol" not in symbol_table
+
+
 class TestSymbolTableRemove:
     def test_remove_by_id(self, symbol_table: SymbolTable):
         id = "x"
@@ -66,6 +66,12 @@ class TestCallInterface:
             "kwarg",
         )
 
+    def test_all_is_cached(self):
+        interface = CallInterface(args=["arg"], kwarg="kwarg")
+
+        assert interface.all is interface.all
+        assert interface == CallInterface(args=["arg"], kwarg="kwarg")
+
     def test_from_fn_def(self, parse):
         fn = parse(
             """
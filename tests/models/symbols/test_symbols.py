@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import pickle
 from importlib.util import find_spec
 from pathlib import Path
 
@@ -151,6 +152,15 @@ class TestName:
         assert Name(name).basename == "my"
         assert Name(name) == Name(name, basename)
 
+    def test_hash_survives_pickling(self):
+        name = Name("my.attr", "my")
+
+        unpickled = pickle.loads(pickle.dumps(name))
+
+        assert unpickled == name
+        assert hash(unpickled) == hash(name)
+        assert unpickled in {name}
+
 
 class TestBuiltin:
     @pytest.mark.parametrize("name", PYTHON_ATTR_ACCESS_BUILTINS)
@@ -302,3 +312,16 @@ class TestCall:
         )
 
         assert Call.from_call("fn", call, target=None) == expected
+
+    def test_hash_survives_pickling(self):
+        call = Call(
+            "fn",
+            args=CallArguments(args=["a"], kwargs={"b": "c"}),
+            target=Func("fn", interface=CallInterface(args=["a", "b"])),
+        )
+
+        unpickled = pickle.loads(pickle.dumps(call))
+
+        assert unpickled == call
+        assert hash(unpickled) == hash(call)
+        assert unpickled in {call}
@@ -78,3 +78,9 @@ class TestGetBasenameFromString:
     def test_is_starred_and_dotted(self):
         assert get_basename_from_name("*my_var.attr") == "my_var"
         assert get_basename_from_name("*my_var.deeply.nested.attrs") == "my_var"
+
+    def test_is_call(self):
+        assert get_basename_from_name("my_func()") == "my_func"
+        assert get_basename_from_name("*my_func()") == "my_func"
+        assert get_basename_from_name("my_var.method()") == "my_var"
+        assert get_basename_from_name("*my_var.attr.method()") == "my_var"
@@ -114,3 +114,18 @@ def test_equality_with_non_matching_context_and_non_matching_ir(
         file_ir=copy.deepcopy(underlying_file_ir_b),
     )
     assert lhs != rhs
+
+
+def test_ir_as_dict_is_an_independent_copy(
+    context_a: Context,
+    underlying_file_ir_a: dict[UserDefinedCallableSymbol, FunctionIr],
+):
+    file_ir = FileIr(context=context_a, file_ir=copy.deepcopy(underlying_file_ir_a))
+
+    as_dict = file_ir.ir_as_dict()
+    assert as_dict == underlying_file_ir_a
+
+    for ir in as_dict.values():
+        ir["gets"].add(Name("another.attr"))
+
+    assert file_ir.ir_as_dict() == underlying_file_ir_a
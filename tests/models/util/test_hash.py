@@ -63,6 +63,19 @@ def test_hash_file_content(file_content: str, expected: str):
         assert hash_file_content(filepath) == expected
 
 
+@pytest.mark.posix
+def test_hash_file_content_across_blocks():
+    file_content = "data\n" * 1000
+
+    with temporary_file(file_content) as filepath:
+        assert hash_file_content(filepath, blocksize=7) == hash_string(file_content)
+        assert hash_file_content(filepath) == hash_string(file_content)
+
+
+def test_hash_file_content_non_existant_file(tmp_path: Path):
+    assert hash_file_content(tmp_path / "nope.py") == hash_string("")
+
+
 def test_hash_python_objects_type_and_source_files_empty_list():
     assert (
         hash_python_objects_type_and_source_files([])  # type: ignore[reportUnknownArgumentType]
@@ -323,3 +323,16 @@ def test_is_in_import_blacklist_from_cli_argument(
             assert is_in_import_blacklist(banned_module)
         for unbanned_module in sorted(unbanned):
             assert not is_in_import_blacklist(unbanned_module)
+
+
+def test_is_in_import_blacklist_with_patterns_not_alternable(arguments: ArgumentsFn):
+    is_in_import_blacklist.cache_clear()
+
+    # Each pattern must match as it would on its own
+    with arguments(_excluded_imports={r"(?i)beelzebub", r"(a)badd\1n"}):
+        assert is_in_import_blacklist("BeelzeBub")
+        assert is_in_import_blacklist("abaddan")
+        assert not is_in_import_blacklist("abaddon")
+        assert not is_in_import_blacklist("michael")
+
+    is_in_import_blacklist.cache_clear()
@@ -94,6 +94,31 @@ def test_find_call_target_and_ir_target_is_a_class_init_defined_in_env(
     assert actual == expected
 
 
+def test_find_call_target_and_ir_target_is_a_class_resolved_by_name(
+    dummy_caller: mock.Mock,
+    example_environment_a: IrEnvironment,
+    example_file_ir_a: FileIr,
+):
+    # The call's target may lack the initialiser's interface, the real class is found
+    # by name in the environment
+    cls_symbol = Class(name="ClassA", interface=CallInterface(args=("self", "arg")))
+    cls_call = IrCall(
+        caller=dummy_caller,
+        symbol=Call(
+            name="ClassA()",
+            args=CallArguments(args=("a",)),
+            target=Class(name="ClassA", interface=None),
+        ),
+    )
+
+    assert example_environment_a.classes == {"ClassA": cls_symbol}
+
+    actual = find_call_target_and_ir(cls_call, environment=example_environment_a)
+    expected = IrTarget(symbol=cls_symbol, ir=example_file_ir_a[cls_symbol])
+
+    assert actual == expected
+
+
 @pytest.mark.pypy()
 def test_find_call_target_and_ir_target_is_in_stdlib(
     example_environment_a: IrEnvironment,
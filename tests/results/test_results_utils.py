@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
 
 from rattr.models.symbol import Call, CallArguments, CallInterface, Class, Func
+from rattr.results import find_call_target_and_ir
 from rattr.results._types import IrCall, IrCallTreeNode, IrTarget
-from rattr.results.util import make_target_ir_call_tree
+from rattr.results.util import make_target_ir_call_tree, post_order_traversal_queue
 from tests.shared import match_output
 
 if TYPE_CHECKING:
@@ -134,6 +136,40 @@ def test_make_target_ir_call_tree_b(
     assert fn_a_actual == fn_a_expected
 
 
+def test_make_target_ir_call_tree_reuses_call_targets(
+    example_environment_b: IrEnvironment,
+):
+    file_ir = example_environment_b.target_ir
+
+    fn_a = Func(name="fn_a", interface=CallInterface(args=("a",)))
+    fn_b = Func(name="fn_b", interface=CallInterface(args=("b",)))
+    targets = [IrTarget(symbol=fn, ir=file_ir[fn]) for fn in (fn_b, fn_a)]
+
+    expected = [
+        make_target_ir_call_tree(target, environment=example_environment_b)
+        for target in targets
+    ]
+
+    call_targets = {}
+    with mock.patch(
+        "rattr.results.util.find_call_target_and_ir",
+        wraps=find_call_target_and_ir,
+    ) as spy:
+        actual = [
+            make_target_ir_call_tree(
+                target,
+                environment=example_environment_b,
+                call_targets=call_targets,
+            )
+            for target in targets
+        ]
+
+    assert actual == expected
+
+    # fn_b calls fn_c and fn_d, fn_a calls fn_b whose callees are then reused
+    assert spy.call_count == 3
+
+
 def test_make_target_ir_call_tree_c(
     example_environment_c: IrEnvironment,
     capfd: pytest.CaptureFixture[str],
@@ -495,3 +531,20 @@ def test_make_target_ir_call_tree_f(
 
     _, stderr = capfd.readouterr()
     assert match_output(stderr, [])
+
+
+def test_post_order_traversal_queue():
+    def node(name: str, *children: IrCallTreeNode) -> IrCallTreeNode:
+        symbol = Func(name=name, interface=CallInterface())
+        return IrCallTreeNode(
+            target=IrTarget(symbol=symbol, ir={}),
+            edge_in=None,
+            edges_out=[],
+            children=list(children),
+        )
+
+    root = node("root", node("a", node("c"), node("d")), node("b", node("e")))
+
+    order = [n.target.symbol.name for n in post_order_traversal_queue(root)]
+
+    assert order == ["e", "d", "c", "b", "a", "root"]
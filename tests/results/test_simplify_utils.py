@@ -75,6 +75,12 @@ from tests.shared import match_output
             "bar",
             "*bar.attr.m().res_attr[].item[]",
         ),
+        (
+            "comp.comp.comp",
+            "comp",
+            "bar",
+            "bar.comp.comp",
+        ),
     ],
 )
 def test_unbind_name(name: str, basename: str, new_basename: str, resultant: str):
@@ -146,6 +152,33 @@ def test_unbind_ir_with_call_swaps_func_with_simple_swap_single(
     assert unbind_ir_with_call_swaps(example_func_ir_a, swap) == expected
 
 
+def test_unbind_ir_with_call_swaps_reuses_unswapped_names(
+    example_func_ir_a: FunctionIr,
+):
+    unbound = unbind_ir_with_call_swaps(example_func_ir_a, {"a": "b"})
+
+    for key in ("gets", "dels"):
+        assert {id(n) for n in unbound[key]} == {id(n) for n in example_func_ir_a[key]}
+
+
+def test_unbind_ir_with_call_swaps_unbinds_shared_names_once():
+    ir = {
+        "sets": {Name("a.attr", "a")},
+        "gets": {Name("a.attr", "a"), Name("a")},
+        "dels": set(),
+        "calls": set(),
+    }
+
+    unbound = unbind_ir_with_call_swaps(ir, {"a": "b"})
+
+    assert unbound["sets"] == {Name("b.attr", "b")}
+    assert unbound["gets"] == {Name("b.attr", "b"), Name("b")}
+
+    [set_name] = unbound["sets"]
+    [get_name] = (n for n in unbound["gets"] if n == set_name)
+    assert set_name is get_name
+
+
 def test_unbind_ir_with_call_swaps_func_with_simple_swaps(
     example_func_ir_a: FunctionIr,
 ):
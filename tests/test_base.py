@@ -1,13 +1,15 @@
 """Rattr Base class tests."""
 from __future__ import annotations
 
+import ast
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest import mock
 
 import pytest
 
-from rattr.analyser.base import Assertor, CustomFunctionAnalyser
+from rattr.analyser.base import Assertor, CustomFunctionAnalyser, NodeVisitor
 from rattr.models.symbol import Call, CallArguments, Name
 
 if TYPE_CHECKING:
@@ -22,6 +24,87 @@ def __set_current_file(state: StateFn) -> Iterator[None]:
         yield
 
 
+class TestNodeVisitor:
+    def test_dispatches_on_node_type(self):
+        class NameVisitor(NodeVisitor):
+            def __init__(self) -> None:
+                self.names: list[str] = []
+
+            def visit_Name(self, node: ast.Name) -> None:
+                self.names.append(node.id)
+
+        visitor = NameVisitor()
+        visitor.visit(ast.parse("a = b + f(c, d=e)"))
+
+        assert visitor.names == ["a", "b", "f", "c", "e"]
+        assert set(NameVisitor._visitors) >= {ast.Module, ast.Assign, ast.Name}
+
+    def test_subclasses_do_not_share_visitors(self):
+        class Base(NodeVisitor):
+            def __init__(self) -> None:
+                self.seen: list[str] = []
+
+            def visit_Name(self, node: ast.Name) -> None:
+                self.seen.append(f"base:{node.id}")
+
+        class Derived(Base):
+            def visit_Name(self, node: ast.Name) -> None:
+                self.seen.append(f"derived:{node.id}")
+
+        base, derived = Base(), Derived()
+        base.visit(ast.parse("a"))
+        derived.visit(ast.parse("a"))
+
+        assert base.seen == ["base:a"]
+        assert derived.seen == ["derived:a"]
+
+    def test_generic_visit_order_matches_ast_node_visitor(self):
+        class Recorder:
+            def __init__(self) -> None:
+                self.seen: list[str] = []
+
+            def visit_Name(self, node: ast.Name) -> None:
+                self.seen.append(node.id)
+
+            def visit_Constant(self, node: ast.Constant) -> None:
+                self.seen.append(repr(node.value))
+
+        class Expected(Recorder, ast.NodeVisitor):
+            pass
+
+        class Actual(Recorder, NodeVisitor):
+            pass
+
+        tree = ast.parse(
+            "def f(a, b=1):\n"
+            "    x = [a[i] for i in range(b) if i]\n"
+            "    return {x: (y, 2), **z}, g(*a, k=3)\n"
+        )
+
+        expected, actual = Expected(), Actual()
+        expected.visit(tree)
+        actual.visit(tree)
+
+        assert actual.seen == expected.seen
+
+    def test_generic_visit_does_not_recurse(self):
+        class NameVisitor(NodeVisitor):
+            def __init__(self) -> None:
+                self.names: list[str] = []
+
+            def visit_Name(self, node: ast.Name) -> None:
+                self.names.append(node.id)
+
+        expr: ast.expr = ast.Name(id="leaf", ctx=ast.Load())
+        for _ in range(sys.getrecursionlimit() * 2):
+            expr = ast.UnaryOp(op=ast.Not(), operand=expr)
+
+        visitor = NameVisitor()
+        visitor.visit(expr)
+
+        assert visitor.names == ["leaf"]
+
+
 class TestAssertor:
     def test_assertor_is_strict(self, capfd: pytest.CaptureFixture[str]):
         assertor = Assertor(is_strict=True)
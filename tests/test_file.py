@@ -7,14 +7,19 @@ from unittest import mock
 
 import pytest
 
-from rattr.analyser.file import FileAnalyser
+from rattr.analyser.file import (
+    FileAnalyser,
+    analyse_origin,
+    parse_and_analyse_file,
+)
 from rattr.models.context import compile_root_context
 from rattr.models.symbol import CallInterface, Func, Name
+from tests.helpers import as_error, stderr_matches
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-    from tests.shared import StateFn
+    from tests.shared import ArgumentsFn, StateFn
 
 
 @pytest.fixture(autouse=True)
@@ -167,6 +172,36 @@ class TestModuleLevelStatements:
 
         assert results.ir_as_dict() == expected
 
+    def test_walrus_nested_lambda(self, parse):
+        # Nested walrus'd lambda
+        _ast = parse(
+            """
+            other = (name := (inner := lambda *a, **k: a.attr))
+            """
+        )
+
+        results = FileAnalyser(_ast, compile_root_context(_ast)).analyse()
+
+        inner = Func(name="inner", interface=CallInterface(vararg="a", kwarg="k"))
+        name = Func(name="name", interface=CallInterface(vararg="a", kwarg="k"))
+
+        expected = {
+            inner: {
+                "calls": set(),
+                "dels": set(),
+                "gets": {Name("a.attr", "a")},
+                "sets": set(),
+            },
+            name: {
+                "calls": set(),
+                "dels": set(),
+                "gets": {Name("a.attr", "a")},
+                "sets": set(),
+            },
+        }
+
+        assert results.ir_as_dict() == expected
+
     def test_walrus_multiple_assignment_lambda(self, parse):
         # Walrus multi assign w/ lambda
         _ast = parse(
@@ -210,3 +245,144 @@ class TestModuleLevelStatements:
         }
 
         assert results.ir_as_dict() == expected
+
+
+class TestAnalyseOrigin:
+    def test_analyse_origin(self, tmp_path: Path):
+        origin = tmp_path / "module.py"
+        origin.write_text("import math\n\ndef fn(a):\n    return a.attr\n")
+
+        file_ir, imports, file_lines = analyse_origin(str(origin))
+
+        assert {f.name for f in file_ir} == {"fn"}
+        assert [i.name for i in imports] == ["math"]
+        assert file_lines == 5
+
+    def test_is_not_shared_between_calls(self, tmp_path: Path):
+        origin = tmp_path / "module.py"
+        origin.write_text("def fn(a):\n    return a.attr\n")
+
+        first, _, _ = analyse_origin(str(origin))
+        second, _, _ = analyse_origin(str(origin))
+
+        assert first is not second
+        assert first.ir_as_dict() == second.ir_as_dict()
+
+        # Mutating one analysis, as simplification does, must not affect another
+        (fn,) = first
+        first[fn]["gets"].clear()
+
+        assert second.ir_as_dict() != first.ir_as_dict()
+
+    def test_diagnostics_are_reported_on_each_call(
+        self,
+        tmp_path: Path,
+        capfd: pytest.CaptureFixture[str],
+    ):
+        origin = tmp_path / "module.py"
+        origin.write_text("def fn(a):\n    return getattr(a, a.name)\n")
+
+        analyse_origin(str(origin))
+        _, first = capfd.readouterr()
+
+        analyse_origin(str(origin))
+        _, second = capfd.readouterr()
+
+        assert "expects name to be a string literal" in first
+        assert second == first
+
+
+class TestParseAndAnalyseImports:
+    @pytest.fixture
+    def target(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        (tmp_path / "mod_a.py").write_text(
+            "from mod_c import c\n\ndef a(x):\n    return c(x.attr)\n"
+        )
+        (tmp_path / "mod_b.py").write_text(
+            "from mod_c import c\n\ndef b(y):\n    y.attr = c(y)\n"
+        )
+        (tmp_path / "mod_c.py").write_text("def c(z):\n    return z.other\n")
+
+        target = tmp_path / "target.py"
+        target.write_text(
+            "from mod_a import a\nfrom mod_b import b\n\n"
+            "def fn(arg):\n    return a(arg), b(arg)\n"
+        )
+
+        return target
+
+    @pytest.mark.posix
+    def test_parallel_analysis_matches_serial_analysis(
+        self,
+        target: Path,
+        arguments: ArgumentsFn,
+    ):
+        with arguments(target=target, _follow_imports_level=1, jobs=1):
+            serial_ir, serial_import_irs, serial_stats = parse_and_analyse_file()
+
+        with arguments(target=target, _follow_imports_level=1, jobs=2):
+            parallel_ir, parallel_import_irs, parallel_stats = parse_and_analyse_file()
+
+        assert list(serial_import_irs) == ["mod_a", "mod_b", "mod_c"]
+        assert list(parallel_import_irs) == list(serial_import_irs)
+
+        for name, import_ir in serial_import_irs.items():
+            assert parallel_import_irs[name].ir_as_dict() == import_ir.ir_as_dict()
+
+        assert parallel_ir.ir_as_dict() == serial_ir.ir_as_dict()
+
+        assert parallel_stats.import_lines == serial_stats.import_lines
+        assert parallel_stats.number_of_imports == serial_stats.number_of_imports
+        assert (
+            parallel_stats.number_of_unique_imports
+            == serial_stats.number_of_unique_imports
+        )
+
+    @pytest.mark.posix
+    def test_parallel_diagnostics_match_serial_diagnostics(
+        self,
+        tmp_path: Path,
+        arguments: ArgumentsFn,
+        capfd: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        modules = ["mod_a", "mod_b", "mod_c", "mod_d"]
+        body = "".join(
+            f"def fn_{i}(x):\n    return getattr(x, x.n)\n" for i in range(3)
+        )
+
+        for module in modules:
+            (tmp_path / f"{module}.py").write_text(body)
+
+        target = tmp_path / "target.py"
+        target.write_text("".join(f"import {module}\n" for module in modules))
+
+        capfd.readouterr()
+
+        with arguments(target=target, _follow_imports_level=1, jobs=1):
+            parse_and_analyse_file()
+
+        _, serial_stderr = capfd.readouterr()
+
+        with arguments(target=target, _follow_imports_level=1, jobs=4):
+            parse_and_analyse_file()
+
+        _, parallel_stderr = capfd.readouterr()
+
+        assert stderr_matches(
+            parallel_stderr,
+            [
+                as_error(
+                    "'getattr' expects name to be a string literal",
+                    file=rf".+/{module}\.py",
+                    line=line,
+                )
+                for module in modules
+                for line in (2, 4, 6)
+            ],
+        )
+        assert parallel_stderr == serial_stderr
@@ -61,6 +61,67 @@ class TestFunctionAnalyser:
 
         assert results == expected
 
+    def test_call_to_method_on_member(
+        self,
+        parse: ParseFn,
+        make_root_context: MakeRootContextFn,
+    ):
+        ast_ = parse(
+            """
+            def a_func(arg):
+                arg.member.inner.method()
+            """
+        )
+        results = FileAnalyser(ast_, compile_root_context(ast_)).analyse()
+
+        a_func = Func(name="a_func", interface=CallInterface(args=("arg",)))
+
+        expected = FileIr(
+            context=make_root_context([a_func], include_root_symbols=True),
+            file_ir={
+                a_func: {
+                    "gets": {
+                        Name("arg.member", "arg"),
+                        Name("arg.member.inner", "arg"),
+                    },
+                    "sets": set(),
+                    "dels": set(),
+                    "calls": {
+                        Call(
+                            name="arg.member.inner.method()",
+                            args=CallArguments(),
+                            target=None,
+                        ),
+                    },
+                }
+            },
+        )
+
+        assert results == expected
+
+    def test_repeated_names_are_located_at_their_first_occurrence(
+        self,
+        parse: ParseFn,
+    ):
+        ast_ = parse(
+            """
+            def a_func(arg):
+                arg.attr = 1
+                arg.attr = arg.attr + arg.attr
+            """
+        )
+        results = FileAnalyser(ast_, compile_root_context(ast_)).analyse()
+
+        first, second = ast_.body[0].body
+        a_func = Func(name="a_func", interface=CallInterface(args=("arg",)))
+
+        [set_name] = results[a_func]["sets"]
+        [get_name] = results[a_func]["gets"]
+
+        assert set_name == get_name == Name("arg.attr", "arg")
+        assert set_name.token is first.targets[0]
+        assert get_name.token is second.value.left
+
     def test_multiple_functions(
         self,
         parse: ParseFn,
@@ -1036,6 +1097,72 @@ class TestFunctionAnalyser:
 
         assert results == expected
 
+    def test_return_nested_containers_with_class(
+        self,
+        parse: ParseFn,
+        make_root_context: MakeRootContextFn,
+        constant: str,
+    ):
+        ast_ = parse(
+            """
+            class MyEnum(Enum):
+                first = "one"
+                second = "two"
+
+            def a_func(blarg):
+                return {
+                    blarg.key: [MyEnum("one"), (blarg.attr, {MyEnum("two")})],
+                    **blarg.rest,
+                }
+            """
+        )
+        results = FileAnalyser(ast_, compile_root_context(ast_)).analyse()
+
+        a_func = Func(name="a_func", interface=CallInterface(args=("blarg",)))
+        my_enum_symbol = Class(
+            name="MyEnum",
+            interface=CallInterface(args=("self", "_id")),
+        )
+        my_enum_first = Name("MyEnum.first", "MyEnum")
+        my_enum_second = Name("MyEnum.second", "MyEnum")
+        my_enum_call = Call(
+            name="MyEnum",
+            args=CallArguments(args=("@ReturnValue", constant)),
+            target=my_enum_symbol,
+        )
+
+        expected = FileIr(
+            context=make_root_context(
+                [
+                    a_func,
+                    my_enum_symbol,
+                    my_enum_first,
+                    my_enum_second,
+                ],
+                include_root_symbols=True,
+            ),
+            file_ir={
+                a_func: {
+                    "sets": set(),
+                    "gets": {
+                        Name("blarg.key", "blarg"),
+                        Name("blarg.attr", "blarg"),
+                        Name("blarg.rest", "blarg"),
+                    },
+                    "dels": set(),
+                    "calls": {my_enum_call},
+                },
+                my_enum_symbol: {
+                    "sets": set(),
+                    "gets": {my_enum_first, my_enum_second},
+                    "calls": set(),
+                    "dels": set(),
+                },
+            },
+        )
+
+        assert results == expected
+
     def test_walrus(
         self,
         parse: ParseFn,
@@ -7,6 +7,8 @@ from unittest import mock
 
 import pytest
 
+from rattr.analyser.file import FileAnalyser
+from rattr.models.context import compile_root_context
 from rattr.models.ir import FileIr
 from rattr.models.results.file import FileResults
 from rattr.models.symbol import (
@@ -24,7 +26,7 @@ from tests.shared import Import_
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-    from tests.shared import FileIrFromDictFn, MakeRootContextFn, StateFn
+    from tests.shared import FileIrFromDictFn, MakeRootContextFn, ParseFn, StateFn
 
 
 @pytest.fixture(autouse=True)
@@ -649,6 +651,82 @@ class TestResults:
 
         assert generate_results_from_ir(target_ir=file_ir, import_irs={}) == expected
 
+    def test_direct_recursion_after_call_to_helper(self, parse: ParseFn):
+        # The recursive call merges the IR of `walk`, including that merged from
+        # `helper`, thus `helper` must be merged first
+        _ast = parse(
+            """
+            def helper(obj):
+                return obj.attr
+
+            def walk(node, depth):
+                helper(node)
+                if depth:
+                    return walk(node.child, depth - 1)
+            """
+        )
+        file_ir = FileAnalyser(_ast, compile_root_context(_ast)).analyse()
+
+        results = generate_results_from_ir(target_ir=file_ir, import_irs={})
+
+        assert results["walk"]["gets"] == {
+            "@BinOp",
+            "depth",
+            "node",
+            "node.attr",
+            "node.child",
+            "node.child.attr",
+            "node.child.child",
+        }
+
+    def test_mutual_recursion_is_simplified_from_each_function(self, parse: ParseFn):
+        # The IR of `alpha` is partial after its own tree is simplified, as the cycle
+        # is cut short, thus `beta` must expand `alpha` rather than reuse its IR
+        _ast = parse(
+            """
+            def alpha(a, b):
+                alpha(b.left, a)
+                beta(a, b)
+
+            def beta(a, b):
+                value = b.attr
+                beta(a.right, a)
+                alpha(a.left, a)
+            """
+        )
+        file_ir = FileAnalyser(_ast, compile_root_context(_ast)).analyse()
+
+        results = generate_results_from_ir(target_ir=file_ir, import_irs={})
+
+        assert results["alpha"]["gets"] == {
+            "a",
+            "a.attr",
+            "a.left",
+            "a.right",
+            "a.right.left",
+            "a.right.right",
+            "b",
+            "b.attr",
+            "b.left",
+        }
+        assert results["beta"]["gets"] == {
+            "a",
+            "a.attr",
+            "a.left",
+            "a.left.attr",
+            "a.left.left",
+            "a.left.right",
+            "a.right",
+            "a.right.attr",
+            "a.right.left",
+            "a.right.right",
+            "b.attr",
+            "b.left",
+            "b.left.attr",
+            "b.left.left",
+            "b.left.right",
+        }
+
 
 class TestResultsEncoder:
     @pytest.fixture
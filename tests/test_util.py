@@ -96,6 +96,23 @@ class TestUtil:
 
         assert get_basename_fullname_pair(nameable, safe=True) == expected
 
+    def test_get_basename_full_name_pair_deeply_nested(self):
+        nameable = ast.parse("a").body[0].value
+
+        for _ in range(sys.getrecursionlimit() * 2):
+            nameable = ast.Attribute(value=nameable, attr="b", ctx=ast.Load())
+
+        basename, fullname = get_basename_fullname_pair(nameable)
+
+        assert basename == "a"
+        assert fullname == "a" + ".b" * (sys.getrecursionlimit() * 2)
+
+    def test_get_basename_full_name_pair_attr_access_fn(self):
+        nameable = ast.parse("*getattr(a.b, 'c')().d[0]").body[0].value
+        expected = ("getattr", "*a.b.c().d[]")
+
+        assert get_basename_fullname_pair(nameable) == expected
+
     def test_get_basename_full_name_pair_coverage(self, constant: str):
         # Name
         nameable = ast.parse("ast_name").body[0].value
@@ -1259,6 +1276,20 @@ class TestUtil:
             assert not is_excluded_name("sin")
             assert is_excluded_name("_hidden_func")
 
+        with arguments(_excluded_names={"sin", "_.*"}):
+            assert is_excluded_name("sin")
+            assert is_excluded_name("_hidden_func")
+            assert not is_excluded_name("sine")
+            assert not is_excluded_name("cos")
+
+        # Each pattern must match as it would on its own
+        with arguments(_excluded_names={"sin", "(?i)_private.*", r"(c)o\1"}):
+            assert is_excluded_name("sin")
+            assert is_excluded_name("_PRIVATE_func")
+            assert is_excluded_name("coc")
+            assert not is_excluded_name("SIN")
+            assert not is_excluded_name("cos")
+
     def test_is_method_on_constant(self, constant: str):
         assert not is_method_on_constant("some_var")
         assert not is_method_on_constant("some_var.methodd")
@@ -1277,6 +1308,12 @@ class TestUtil:
         assert is_method_on_cast("set().union")
         assert is_method_on_cast("list().append")
 
+        # Non-primitive returning builtins, and calls to calls
+        assert not is_method_on_cast("getattr().attr")
+        assert not is_method_on_cast("iter().method")
+        assert not is_method_on_cast("list().copy().append")
+        assert not is_method_on_cast("list()().append")
+
     def test_is_method_on_primitive(self, constant: str):
         assert not is_method_on_primitive(constant)
         assert not is_method_on_primitive("some_var")